@@ -0,0 +1,87 @@
+"""
+Times author formatting on a synthetic bibliography: the old split-on-" and "
+formatter against the memoized BibTeX name parser (format_authors), with cold
+and warm caches, plus building the inverted indexes (warm caches).
+
+    python benchmarks/bench_authors.py --entries 10000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import configure, write_bib  # noqa: E402
+
+
+def legacy_format_authors(entry):
+    """format_authors before the BibTeX name parser, for reference."""
+    raw_authors = entry.get('author', 'Unknown').replace('\n', ' ')
+    formatted_authors = []
+    for name in raw_authors.split(' and '):
+        parts = name.split(',', 1)
+        if len(parts) == 2:
+            formatted_authors.append(f"{parts[1].strip()} {parts[0].strip()}")
+        else:
+            formatted_authors.append(name.strip())
+    return ", ".join(formatted_authors)
+
+
+def clear_caches():
+    main._format_author_field.cache_clear()
+    main.parse_authors.cache_clear()
+    main.parse_author_name.cache_clear()
+    main.latex_to_unicode.cache_clear()
+
+
+def timed(func, entries, setup=None, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for entry in entries:
+            func(entry)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(entries, repeat):
+    workdir = tempfile.mkdtemp(prefix="bench-authors-")
+    try:
+        configure(workdir)
+        bib_file = main.BIB_FILE
+        os.makedirs(os.path.dirname(bib_file))
+        write_bib(bib_file, entries)
+        data = main.load_bib_data(bib_file)
+        # Every entry twice: once for its page, once for the table row
+        calls = data + data
+
+        legacy = timed(legacy_format_authors, calls, repeat=repeat)
+        cold = timed(main.format_authors, calls, clear_caches, repeat=repeat)
+        warm = timed(main.format_authors, calls, repeat=repeat)
+        print(f"{len(calls)} calls ({entries} entries)")
+        print(f"  legacy split                {legacy:8.4f}s")
+        print(f"  format_authors (cold cache) {cold:8.4f}s")
+        print(f"  format_authors (warm cache) {warm:8.4f}s")
+        print(f"  cache: {main.parse_author_name.cache_info()}")
+
+        main._BIB_CACHE[os.path.abspath(bib_file)]['indexes'] = None
+        start = time.perf_counter()
+        indexes = main.load_bib_indexes(bib_file)
+        print(f"  inverted indexes ({len(indexes['author'])} authors) "
+              f"{time.perf_counter() - start:8.4f}s")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.entries, args.repeat)
@@ -0,0 +1,45 @@
+"""
+Times create_publication_pages on a synthetic bibliography: a cold run into
+an empty output folder, then a run where nothing changed.
+
+    python benchmarks/bench_publication_pages.py --entries 10000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import configure, write_bib  # noqa: E402
+
+
+def run(entries):
+    workdir = tempfile.mkdtemp(prefix="bench-pubs-")
+    try:
+        configure(workdir)
+        bib_file = main.BIB_FILE
+        os.makedirs(os.path.dirname(bib_file))
+        write_bib(bib_file, entries)
+
+        start = time.perf_counter()
+        main.load_bib_index(bib_file)
+        print(f"parse {entries} entries: {time.perf_counter() - start:.2f}s")
+
+        for label in ("cold", "unchanged"):
+            main._STEPS.clear()
+            start = time.perf_counter()
+            main.create_publication_pages()
+            print(f"{label:>10} {time.perf_counter() - start:>9.2f}s")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    args = parser.parse_args()
+    run(args.entries)
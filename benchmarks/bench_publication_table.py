@@ -0,0 +1,62 @@
+"""
+Times the generate_publication_table macro on a synthetic bibliography.
+The bib is parsed (and cached in memory) before timing, so only the HTML
+generation is measured.
+
+    python benchmarks/bench_publication_table.py --entries 10000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+from synthetic import configure, write_bib  # noqa: E402
+
+
+class MacroCollector:
+    """Just enough of the mkdocs-macros env for define_env to register macros."""
+
+    def __init__(self):
+        self.macros = {}
+        self.variables = {}
+        self.conf = {}
+
+    def macro(self, func):
+        self.macros[func.__name__] = func
+        return func
+
+
+def run(entries, repeat):
+    workdir = tempfile.mkdtemp(prefix="bench-table-")
+    try:
+        configure(workdir)
+        bib_file = main.BIB_FILE
+        os.makedirs(os.path.dirname(bib_file))
+        write_bib(bib_file, entries)
+
+        env = MacroCollector()
+        main.define_env(env)
+        table = env.macros["generate_publication_table"]
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            html = table(bib_file)
+            timings.append(time.perf_counter() - start)
+        print(f"{entries} rows, {len(html) / 1e6:.1f} MB: "
+              f"best {min(timings):.3f}s of {repeat}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.entries, args.repeat)
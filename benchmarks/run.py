@@ -0,0 +1,252 @@
+"""
+Benchmark harness for the site build pipeline (main.py).
+
+Generates synthetic bibliographies and blog/talks/projects trees of each
+requested size, times the hot paths and writes the results as JSON so runs
+can be compared across commits:
+
+    python benchmarks/run.py --sizes 100 1000 10000 50000 --output before.json
+    python benchmarks/run.py --compare before.json --tolerance 0.25
+
+With --compare, the run fails (exit code 1) when any stage is slower than
+the baseline by more than the tolerance and by at least --min-delta seconds
+(5 ms by default, so that memoized stages do not fail on timer noise).
+
+Stages:
+    load_bib_data               cold parse (empty cache folder)
+    load_bib_data_cached        parse replayed from the on-disk cache
+    create_publication_pages    render every page (bib already parsed)
+    create_publication_pages_noop   second run, nothing changed
+    generate_publication_table  full table, macro cache disabled
+    generate_rotating_grid      newest 5 of the synthetic blog posts
+    write_search_index          sharded search index of bib + Markdown trees
+    rebuild_noop                `mkdocs serve` rebuild (pages + search index), nothing changed
+    rebuild_bib_edit            the same after editing the title of one bib entry
+    mkdocs_build                end-to-end `mkdocs build` (--e2e-sizes only)
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import main  # noqa: E402
+from bench_publication_table import MacroCollector  # noqa: E402
+from synthetic import configure, write_bib, write_markdown_tree  # noqa: E402
+
+
+# Slowdowns smaller than this (seconds) are never reported by --compare
+MIN_DELTA = 0.005
+
+
+def reset_state():
+    """Forgets everything main.py keeps in memory between builds."""
+    main._BIB_CACHE.clear()
+    main._BIB_RECORDS.clear()
+    main._STEPS.clear()
+    main._SEARCH_DOCUMENTS.clear()
+    main._ASSET_INDEX.clear()
+    main._IMAGE_VARIANTS.clear()
+    main._PDF_MANIFEST.clear()
+    main._METADATA_CACHE.clear()
+    main._POST_URLS.clear()
+    main._PUBLICATIONS.clear()
+    main._BIBTEX_SNIPPETS.clear()
+    main._FOLDER_LISTINGS.clear()
+
+
+def best_of(repeat, func, setup=None):
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def make_corpus(workdir, size):
+    docs = os.path.join(workdir, "docs")
+    os.makedirs(os.path.join(docs, "assets"), exist_ok=True)
+    write_bib(os.path.join(docs, "assets", "publications.bib"), size)
+    write_markdown_tree(os.path.join(docs, "blog", "posts"), size, kind="post")
+    write_markdown_tree(os.path.join(docs, "talks"), max(10, size // 100), kind="talk")
+    write_markdown_tree(os.path.join(docs, "projects"), max(10, size // 100), kind="project")
+
+
+def bench_size(size, repeat):
+    workdir = tempfile.mkdtemp(prefix=f"bench-{size}-")
+    results = {}
+    try:
+        make_corpus(workdir, size)
+        configure(workdir)
+
+        def cold():
+            reset_state()
+            shutil.rmtree(main.CACHE_DIR, ignore_errors=True)
+
+        # Cold parses are slow on big corpora; one run is representative
+        results["load_bib_data"] = best_of(1 if size > 1000 else repeat,
+                                           lambda: main.load_bib_data(main.BIB_FILE), cold)
+        results["load_bib_data_cached"] = best_of(repeat, lambda: main.load_bib_data(main.BIB_FILE),
+                                                  reset_state)
+
+        def empty_output():
+            shutil.rmtree(main.PUB_OUTPUT_DIR, ignore_errors=True)
+            if os.path.exists(main._manifest_path()):
+                os.remove(main._manifest_path())
+            main._ASSET_INDEX.clear()
+
+        results["create_publication_pages"] = best_of(repeat, main.create_publication_pages, empty_output)
+        results["create_publication_pages_noop"] = best_of(repeat, main.create_publication_pages)
+
+        env = MacroCollector()
+        main.define_env(env)
+        posts = os.path.join(workdir, "docs", "blog", "posts")
+        results["generate_publication_table"] = best_of(
+            repeat, lambda: env.macros["generate_publication_table"](main.BIB_FILE))
+        def new_build():
+            main._FOLDER_LISTINGS.clear()
+            main._BLOG_ROUTES.clear()
+            main._ROTATING_ITEMS.clear()
+
+        results["generate_rotating_grid"] = best_of(
+            repeat, lambda: env.macros["generate_rotating_grid"](folder=posts, order="newest"),
+            new_build)
+        site = os.path.join(workdir, "site")
+        def new_index():
+            main._FOLDER_LISTINGS.clear()
+            main._BLOG_ROUTES.clear()
+            main._STEPS.clear()
+            main._SEARCH_DOCUMENTS.clear()
+
+        results["write_search_index"] = best_of(
+            repeat, lambda: main.write_search_index(site, main.BIB_FILE), new_index)
+
+        def rebuild():
+            main._prepare_build()
+            main.write_search_index(site, main.BIB_FILE)
+
+        def edit_bib():
+            with open(main.BIB_FILE, encoding="utf-8") as f:
+                text = f.read()
+            edited = "title = {Edited " if "title = {Edited " not in text else "title = {"
+            with open(main.BIB_FILE, "w", encoding="utf-8") as f:
+                f.write(re.sub(r"title = \{(Edited )?", lambda _: edited, text, count=1))
+
+        rebuild()
+        results["rebuild_noop"] = best_of(repeat, rebuild)
+        results["rebuild_bib_edit"] = best_of(repeat, rebuild, edit_bib)
+    finally:
+        shutil.rmtree(workdir)
+    return results
+
+
+def bench_mkdocs_build(size):
+    """Builds a copy of the site with synthetic content, offline."""
+    workdir = tempfile.mkdtemp(prefix=f"bench-e2e-{size}-")
+    try:
+        shutil.copytree(os.path.join(ROOT, "docs"), os.path.join(workdir, "docs"))
+        shutil.copy(os.path.join(ROOT, "main.py"), workdir)
+        # The social plugin downloads fonts and renders cards: not offline
+        with open(os.path.join(ROOT, "mkdocs.yml"), encoding="utf-8") as f:
+            config = [line for line in f if line.strip() != "- social"]
+        with open(os.path.join(workdir, "mkdocs.yml"), "w", encoding="utf-8") as f:
+            f.writelines(config)
+
+        docs = os.path.join(workdir, "docs")
+        write_bib(os.path.join(docs, "assets", "publications.bib"), size)
+        write_markdown_tree(os.path.join(docs, "blog", "posts", "synthetic"), size, kind="post")
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-m", "mkdocs", "build", "-q", "-d", "site"],
+                       cwd=workdir, check=True, env=dict(os.environ, MACRO_CACHE="0"))
+        return time.perf_counter() - start
+    finally:
+        shutil.rmtree(workdir)
+
+
+def git_revision():
+    try:
+        revision = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                               capture_output=True, text=True, check=True).stdout.strip()
+        return revision + ("-dirty" if dirty else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, tolerance, min_delta=MIN_DELTA):
+    """
+    Returns the (stage, size, before, after) entries slower than allowed.
+    A stage must also be slower by at least `min_delta` seconds: memoized
+    stages take a few milliseconds, where a relative tolerance is timer noise.
+    """
+    regressions = []
+    for stage, timings in results.items():
+        for size, seconds in timings.items():
+            before = baseline.get(stage, {}).get(size)
+            if before and seconds > before * (1 + tolerance) and seconds - before >= min_delta:
+                regressions.append((stage, size, before, seconds))
+    return regressions
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--e2e-sizes", type=int, nargs="*", default=[100, 1000],
+                        help="sizes for the end-to-end mkdocs build (slow)")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N for each stage")
+    parser.add_argument("--output", default=os.path.join(ROOT, "benchmarks", "results", "latest.json"))
+    parser.add_argument("--compare", metavar="BASELINE", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown vs the baseline (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=MIN_DELTA,
+                        help="ignore slowdowns smaller than this many seconds")
+    args = parser.parse_args()
+
+    results = {}
+    for size in args.sizes:
+        print(f"size {size}...", flush=True)
+        for stage, seconds in bench_size(size, args.repeat).items():
+            results.setdefault(stage, {})[str(size)] = seconds
+            print(f"  {stage:<32} {seconds:>9.4f}s", flush=True)
+    for size in args.e2e_sizes:
+        seconds = bench_mkdocs_build(size)
+        results.setdefault("mkdocs_build", {})[str(size)] = seconds
+        print(f"  mkdocs_build ({size}){'':<18} {seconds:>9.4f}s", flush=True)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }, f, indent=2, sort_keys=True)
+    print(f"results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.tolerance, args.min_delta)
+        for stage, size, before, after in regressions:
+            print(f"REGRESSION {stage} @ {size}: {before:.4f}s -> {after:.4f}s "
+                  f"(+{(after / before - 1) * 100:.0f}%)")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.tolerance:.0%} vs {args.compare}")
+
+
+if __name__ == "__main__":
+    main_cli()
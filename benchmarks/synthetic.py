@@ -0,0 +1,108 @@
+"""
+Synthetic corpora for the benchmarks: deterministic fake bibliographies that
+exercise the same fields as docs/assets/publications.bib, and Markdown trees
+shaped like the blog, talks and projects folders.
+"""
+import datetime
+import os
+import random
+
+import main
+
+FIRST_NAMES = ["Vasilis", "Vasiliki", "Nikolaos", "Ioannis", "Maria", "Eleni",
+               "Georgios", "Anna", "Dimitris", "Sofia", "Kostas", "Katerina"]
+LAST_NAMES = ["Tsilidis", "Bitsouni", "Gialelis", "Stratis", "Papadopoulos",
+              "Georgiou", "Nikolaou", "Ioannou", "Christou", "Dimitriou"]
+WORDS = ["mathematical", "model", "immune", "response", "cancer", "dynamics",
+         "epidemic", "age-structured", "vaccination", "lockdown", "analysis",
+         "stochastic", "optimal", "control", "cells", "tumour", "estimation"]
+VENUES = ["Journal of Theoretical Biology", "Mathematical Biosciences",
+          "Infectious Disease Modelling", "Studies in Applied Mathematics",
+          "Bulletin of Mathematical Biology"]
+MONTHS = ["jan", "feb", "mar", "apr", "may", "jun",
+          "jul", "aug", "sep", "oct", "nov", "dec"]
+
+
+def bib_entry(i, rng):
+    authors = " and ".join(
+        f"{rng.choice(LAST_NAMES)}, {rng.choice(FIRST_NAMES)}"
+        for _ in range(rng.randint(1, 6))
+    )
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))).capitalize()
+    abstract = " ".join(rng.choice(WORDS) for _ in range(rng.randint(60, 200)))
+    fields = [
+        f"  title = {{{title}}}",
+        f"  author = {{{authors}}}",
+        f"  journal = {{{rng.choice(VENUES)}}}",
+        f"  year = {{{rng.randint(1995, 2025)}}}",
+        f"  month = {{{rng.choice(MONTHS)}}}",
+        f"  abstract = {{{abstract}}}",
+        f"  doi = {{10.{rng.randint(1000, 9999)}/synthetic.{i}}}",
+    ]
+    if rng.random() < 0.3:
+        fields.append(f"  eprint = {{{rng.randint(1000, 2599)}.{rng.randint(10000, 99999)}}}")
+    if rng.random() < 0.2:
+        fields.append(f"  code = {{https://github.com/example/paper-{i}}}")
+    return "@article{synthetic_%06d,\n%s\n}\n" % (i, ",\n".join(fields))
+
+
+def write_bib(path, n_entries, seed=0):
+    """Writes a bibliography with `n_entries` random articles to `path`."""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(n_entries):
+            f.write(bib_entry(i, rng))
+            f.write("\n")
+
+
+CATEGORIES = ["Coding", "Python", "Docker", "Data Engineering", "Cloud Computing"]
+
+
+def write_markdown_tree(folder, n_files, kind="post", seed=0):
+    """
+    Writes `n_files` Markdown files with frontmatter shaped like the site's
+    blog posts, talks or projects (`kind`) into `folder`, ten per subfolder.
+    """
+    rng = random.Random(seed)
+    for i in range(n_files):
+        subfolder = os.path.join(folder, f"group-{i // 10:04d}")
+        os.makedirs(subfolder, exist_ok=True)
+        title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))).capitalize()
+        day = datetime.date(2015, 1, 1) + datetime.timedelta(days=rng.randint(0, 4000))
+        meta = [
+            f"date: {day.isoformat()}",
+            f'title: "{title} {i}"',
+            f'description: "{" ".join(rng.choice(WORDS) for _ in range(25))}"',
+        ]
+        if kind == "post":
+            meta.append("categories:\n" + "\n".join(f"  - {c}" for c in rng.sample(CATEGORIES, 2)))
+        elif kind == "talk":
+            meta.append(f"short_conference_title: {rng.choice(VENUES)[:20]}")
+        elif kind == "project":
+            meta.append(f"weight: {rng.randint(0, 10)}")
+            meta.append("tags:\n" + "\n".join(f"  - {w}" for w in rng.sample(WORDS, 3)))
+        body = "\n\n".join(
+            " ".join(rng.choice(WORDS) for _ in range(80)) for _ in range(rng.randint(5, 20))
+        )
+        path = os.path.join(subfolder, f"{kind}-{i:06d}.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("---\n" + "\n".join(meta) + "\n---\n\n# " + title + "\n\n" + body + "\n")
+
+
+def configure(workdir):
+    """
+    Points main.py at the synthetic project in `workdir`: every input, output
+    and cache folder, so that a benchmark never touches the repository.
+    """
+    docs = os.path.join(workdir, "docs")
+    main.BIB_FILE = os.path.join(docs, "assets", "publications.bib")
+    main.PUB_OUTPUT_DIR = os.path.join(docs, "publications")
+    main.PUB_IMAGE_DIR_ABS = os.path.join(docs, "assets", "images", "publications")
+    main.PUB_PDF_DIR_ABS = os.path.join(docs, "pdfs", "publications")
+    main.PUB_INDEX_OUTPUT_DIR = os.path.join(docs, "publications-by")
+    main.BLOG_POST_DIR = os.path.join(docs, "blog", "posts")
+    main.CACHE_DIR = os.path.join(workdir, ".cache")
+    main.SEARCH_SOURCES = {kind: os.path.join(docs, folder)
+                           for kind, folder in [('talk', "talks"), ('post', os.path.join("blog", "posts")),
+                                                ('project', "projects")]}
+    main.MACRO_CACHE_ENABLED = False
@@ -0,0 +1,101 @@
+// Publication table rendered by generate_publication_table(page_size=...).
+// Only the first page of rows is in the HTML; the full list is fetched from
+// the JSON feed the first time it is needed and filtered/sorted client-side.
+(function () {
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, (c) => ({
+            "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"
+        })[c]);
+    }
+
+    // Same markup as the server-side row template
+    function rowHtml(pub) {
+        return `
+    <tr>
+        <td class="year-cell">${pub.year}</td>
+        <td>
+            <div class="pub-title">
+                <a href="${escapeHtml(pub.page_link)}" class="title-link">${pub.title}</a>
+            </div>
+            <div class="pub-authors">${pub.authors}</div>
+        </td>
+        <td class="venue-cell">${pub.venue}</td>
+        <td style="text-align: center;">
+            ${pub.links}
+        </td>
+    </tr>`;
+    }
+
+    const sorters = {
+        // The feed is already newest first
+        newest: null,
+        oldest: (a, b) => String(a.pub.year).localeCompare(String(b.pub.year)) || a.i - b.i,
+        title: (a, b) => a.pub.title.localeCompare(b.pub.title),
+    };
+
+    function initTable(table) {
+        const container = table.closest(".table-container");
+        const tbody = table.tBodies[0];
+        const filter = container.querySelector(".pub-table-filter");
+        const sort = container.querySelector(".pub-table-sort");
+        const more = container.querySelector(".pub-table-more");
+        const pageSize = parseInt(table.dataset.pageSize, 10) || 50;
+
+        let feed = null;
+        let view = null;
+        let shown = tbody.rows.length;
+
+        function load() {
+            if (!feed) {
+                feed = fetch(table.dataset.feed)
+                    .then((response) => response.json())
+                    .then((pubs) => pubs.map((pub, i) => ({
+                        pub,
+                        i,
+                        text: [pub.year, pub.title, pub.authors, pub.venue].join(" ").toLowerCase(),
+                    })));
+            }
+            return feed;
+        }
+
+        function appendPage() {
+            const next = view.slice(shown, shown + pageSize);
+            tbody.insertAdjacentHTML("beforeend", next.map((item) => rowHtml(item.pub)).join(""));
+            shown += next.length;
+            if (more) more.hidden = shown >= view.length;
+        }
+
+        function update() {
+            load().then((items) => {
+                const query = filter ? filter.value.trim().toLowerCase() : "";
+                view = query ? items.filter((item) => item.text.includes(query)) : items.slice();
+                const sorter = sort ? sorters[sort.value] : null;
+                if (sorter) view.sort(sorter);
+                tbody.textContent = "";
+                shown = 0;
+                appendPage();
+            });
+        }
+
+        if (more) {
+            more.addEventListener("click", () => {
+                load().then((items) => {
+                    view = view || items;
+                    appendPage();
+                });
+            });
+        }
+        if (filter) {
+            let timer = null;
+            filter.addEventListener("input", () => {
+                clearTimeout(timer);
+                timer = setTimeout(update, 150);
+            });
+        }
+        if (sort) sort.addEventListener("change", update);
+    }
+
+    document.addEventListener("DOMContentLoaded", () => {
+        document.querySelectorAll(".neon-table[data-feed]").forEach(initTable);
+    });
+})();
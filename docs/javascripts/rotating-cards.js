@@ -0,0 +1,36 @@
+// Rotating cards rendered by generate_rotating_grid(). The progress bar runs
+// an infinite CSS animation and every iteration shows the next item, so the
+// script only swaps classes: it never reads layout or restarts the animation.
+// Cards off-screen are paused (IntersectionObserver), hover pauses via CSS.
+(function () {
+    function initCard(card, observer) {
+        const items = card.querySelectorAll(".rotating-item");
+        const bar = card.querySelector(".ticker-bar");
+        if (items.length < 2 || !bar) return;
+
+        let currentIndex = 0;
+        bar.addEventListener("animationiteration", () => {
+            let nextIndex;
+            do { nextIndex = Math.floor(Math.random() * items.length); } while (nextIndex === currentIndex);
+            items[currentIndex].classList.remove("active");
+            items[nextIndex].classList.add("active");
+            currentIndex = nextIndex;
+        });
+
+        bar.style.animationDuration = `${parseInt(card.dataset.interval, 10) || 5000}ms`;
+        if (observer) {
+            card.classList.add("is-offscreen");
+            observer.observe(card);
+        }
+        bar.classList.add("animate-progress");
+    }
+
+    document.addEventListener("DOMContentLoaded", () => {
+        const observer = "IntersectionObserver" in window
+            ? new IntersectionObserver((entries) => {
+                entries.forEach((entry) => entry.target.classList.toggle("is-offscreen", !entry.isIntersecting));
+            })
+            : null;
+        document.querySelectorAll(".rotating-card[data-rotator]").forEach((card) => initCard(card, observer));
+    });
+})();
@@ -0,0 +1,118 @@
+// Search box rendered by generate_search_box(). The index written by
+// write_search_index() is split into token shards (by prefix) and document
+// chunks; only the manifest and the pieces a query touches are downloaded.
+(function () {
+    const MAX_RESULTS = 20;
+    const LABELS = { publication: "Publication", talk: "Talk", post: "Post", project: "Project" };
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, (c) => ({
+            "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"
+        })[c]);
+    }
+
+    // Same normalization as _search_tokens() in main.py
+    function tokenize(text) {
+        const folded = text.toLowerCase().normalize("NFKD").replace(/\p{M}/gu, "");
+        return (folded.match(/[\p{L}\p{N}]+/gu) || []).filter((word) => word.length >= 2);
+    }
+
+    function shardName(prefix) {
+        if (/^[a-z0-9]+$/.test(prefix)) return prefix;
+        return "_" + [...prefix].map((c) => c.codePointAt(0).toString(16)).join("-");
+    }
+
+    function createIndex(base) {
+        const files = new Map();
+        function fetchJson(name) {
+            if (!files.has(name)) {
+                files.set(name, fetch(base + name).then((response) => {
+                    if (!response.ok) throw new Error(`${response.status} ${name}`);
+                    return response.json();
+                }));
+            }
+            return files.get(name);
+        }
+
+        // Sorted ids of the documents with a token starting with `word`
+        async function lookup(word, manifest) {
+            const name = shardName([...word].slice(0, manifest.prefix_length).join(""));
+            if (!manifest.shards.includes(name)) return [];
+            const shard = await fetchJson(name + ".json");
+            const ids = new Set();
+            for (const token in shard) {
+                if (token.startsWith(word)) shard[token].forEach((id) => ids.add(id));
+            }
+            return [...ids].sort((a, b) => a - b);
+        }
+
+        async function search(query) {
+            const manifest = await fetchJson("manifest.json");
+            const words = [...new Set(tokenize(query))];
+            if (!words.length) return null;
+
+            const postings = await Promise.all(words.map((word) => lookup(word, manifest)));
+            // Every word must match; ids are already in priority order
+            let matches = postings[0];
+            for (const ids of postings.slice(1)) {
+                const keep = new Set(ids);
+                matches = matches.filter((id) => keep.has(id));
+            }
+
+            const shown = matches.slice(0, MAX_RESULTS);
+            const chunks = await Promise.all([...new Set(shown.map((id) => Math.floor(id / manifest.chunk_size)))]
+                .map((n) => fetchJson(`docs-${n}.json`).then((docs) => [n, docs])));
+            const byChunk = new Map(chunks);
+            return {
+                total: matches.length,
+                docs: shown.map((id) => byChunk.get(Math.floor(id / manifest.chunk_size))[id % manifest.chunk_size]),
+            };
+        }
+
+        return { search, warm: () => fetchJson("manifest.json") };
+    }
+
+    function initSearch(box) {
+        const input = box.querySelector(".site-search-input");
+        const status = box.querySelector(".site-search-status");
+        const list = box.querySelector(".site-search-results");
+        const index = createIndex(box.dataset.index);
+        let latest = 0;
+        let timer = null;
+
+        async function run() {
+            const ticket = ++latest;
+            let result;
+            try {
+                result = await index.search(input.value);
+            } catch (error) {
+                status.textContent = "Search is unavailable right now.";
+                return;
+            }
+            // A newer query finished first
+            if (ticket !== latest) return;
+            if (!result) {
+                status.textContent = "";
+                list.innerHTML = "";
+                return;
+            }
+            status.textContent = result.total === 1 ? "1 result" : `${result.total} results`;
+            list.innerHTML = result.docs.map(([type, title, url, subtitle]) => `
+                <li>
+                    <span class="site-search-type">${escapeHtml(LABELS[type] || type)}</span>
+                    <a href="${escapeHtml(url)}">${escapeHtml(title)}</a>
+                    <div class="site-search-subtitle">${escapeHtml(subtitle)}</div>
+                </li>`).join("");
+        }
+
+        input.addEventListener("focus", () => index.warm().catch(() => {}), { once: true });
+        input.addEventListener("input", () => {
+            clearTimeout(timer);
+            timer = setTimeout(run, 150);
+        });
+    }
+
+    document.addEventListener("DOMContentLoaded", () => {
+        document.querySelectorAll(".site-search[data-index]").forEach(initSearch);
+    });
+})();
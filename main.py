@@ -1,8 +1,32 @@
+import asyncio
 import bibtexparser
+import functools
+import hashlib
+import heapq
+import json
+import logging
 import os
+import pickle
+import posixpath
 import re
+import shutil
+import subprocess
+import sys
+import time
+import types
+import unicodedata
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from textwrap import dedent
+from xml.etree import ElementTree
+from babel.dates import format_datetime
+from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader
 from markupsafe import Markup
+from PIL import Image, features
+from pymdownx.slugs import slugify
 import frontmatter
 import datetime
 import markdown
@@ -15,55 +39,1329 @@ PUB_OUTPUT_DIR = "docs/publications"
 # Example: docs/assets/images/publications/my_paper_key.png
 PUB_IMAGE_DIR_REL = "assets/images/publications" 
 PUB_IMAGE_DIR_ABS = "docs/assets/images/publications"
+# First match wins when a paper ships several images
+PUB_IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.gif', '.webp']
+# Local PDFs, picked up automatically as docs/pdfs/publications/<key>.pdf
+PUB_PDF_DIR_REL = "pdfs/publications"
+PUB_PDF_DIR_ABS = "docs/pdfs/publications"
+# The PDFs are published a second time under a content-hashed name
+# (<sha256 prefix>.pdf) in this folder of the built site, and the buttons link
+# there: the URL changes with the file, so it can be cached forever, and
+# identical files share one blob. The copies are hard links when possible.
+PUB_PDF_HASHED_DIR_REL = "pdfs/hashed"
+# Keep /pdfs/publications/<key>.pdf in the site for existing inbound links
+PUB_PDF_KEEP_ORIGINALS = True
+# Linearize ("fast web view") the published PDFs with qpdf, if installed, so
+# browsers can show the first page before the whole file is downloaded.
+PUB_PDF_LINEARIZE = os.environ.get("PDF_LINEARIZE") == "1"
+# Folder for build caches that survive between runs (parsed bib, manifests...).
+# Set to None to keep everything in memory only.
+CACHE_DIR = ".cache/main"
+# Bump when the shape of the cached data changes to invalidate old caches
+BIB_CACHE_VERSION = 2
+# Entries parsed (and handed to the page generator) at a time; bounds the
+# memory used when streaming very large bibliographies
+BIB_CHUNK_SIZE = 500
+# Bump when the data fed to the publication page template changes so that
+# every page is re-rendered on the next build (template edits are detected)
+PUB_TEMPLATE_VERSION = 2
+# Resized copies of the publication images, generated with Pillow into
+# CACHE_DIR/images (keyed by the source hash) and copied into the built site
+# under PUB_IMAGE_VARIANT_DIR_REL. Widths larger than the source are skipped;
+# formats the installed Pillow cannot encode are skipped too.
+PUB_IMAGE_WIDTHS = [480, 960, 1440]
+PUB_IMAGE_FORMATS = {'avif': {'quality': 55}, 'webp': {'quality': 80, 'method': 4}}
+PUB_IMAGE_SIZES = "(max-width: 960px) 100vw, 960px"
+PUB_IMAGE_VARIANT_DIR_REL = "assets/images/publications/variants"
+# Browsing pages generated from the inverted indexes of the bib (one page per
+# author, venue and year, plus an overview per kind), e.g.
+# /publications-by/author/<slug>/. The folder is owned by the generator:
+# Markdown files it did not produce there are deleted.
+PUB_INDEX_OUTPUT_DIR = "docs/publications-by"
+PUB_INDEX_PAGES = ['author', 'venue', 'year']
+# Default seed of the "random" order of generate_rotating_grid: "content"
+# (changes when the items do), "date" (changes daily) or any fixed string.
+ROTATING_GRID_SEED = os.environ.get("ROTATING_GRID_SEED", "content")
+# Sharded search index of the structured data (bib entries, talk, post and
+# project frontmatter) written next to the built site and queried on demand
+# by javascripts/site-search.js. Tokens are sharded by their first
+# SEARCH_PREFIX_LENGTH characters; documents are stored in chunks.
+SEARCH_INDEX_DIR = "assets/data/search"
+SEARCH_SOURCES = {'talk': "docs/talks", 'post': "docs/blog/posts", 'project': "docs/projects"}
+SEARCH_PREFIX_LENGTH = 2
+SEARCH_DOC_CHUNK_SIZE = 500
+# Metadata fetched from Crossref (by DOI) and arXiv by `python main.py enrich`.
+# Builds only read this file (never the network) and use it to fill in the
+# abstract, venue and DOI of entries that lack them. Commit it so CI builds
+# get the same data. The base URLs can point to a local stub server.
+ENRICHMENT_CACHE = "publications-metadata.json"
+ENRICH_CROSSREF_URL = os.environ.get("ENRICH_CROSSREF_URL", "https://api.crossref.org/works/")
+ENRICH_ARXIV_URL = os.environ.get("ENRICH_ARXIV_URL", "https://export.arxiv.org/api/query")
+ENRICH_CONCURRENCY = 4
+ENRICH_TIMEOUT = 20
+# Jinja2 templates found here override the built-in ones of the same name
+# (see DEFAULT_TEMPLATES), e.g. templates/publication_page.md
+TEMPLATE_DIR = "templates"
+# JSON index of all publications written next to the built site; feeds the
+# client-side filtering/sorting/paging of generate_publication_table(page_size=...)
+PUB_FEED_PATH = "assets/data/publications.json"
+# Rendered macro output is cached in CACHE_DIR/macros across builds and
+# `mkdocs serve` reloads. Disable with MACRO_CACHE=0, clear with
+# MAIN_CLEAR_CACHE=1 or `python main.py clear-cache`.
+MACRO_CACHE_ENABLED = os.environ.get("MACRO_CACHE", "1") != "0"
+# Least recently used outputs are evicted above this size
+MACRO_CACHE_MAX_BYTES = 32 * 1024 * 1024
+# Build instrumentation (timings, files read, bytes written, cache hits per
+# hook and macro). Enable with MAIN_PROFILE=1 or `extra: {main_profile: true}`
+# in mkdocs.yml; the JSON report is written to CACHE_DIR/PROFILE_REPORT.
+PROFILE_ENABLED = os.environ.get("MAIN_PROFILE") == "1"
+PROFILE_REPORT = "build-profile.json"
+
+log = logging.getLogger("mkdocs.plugins.main")
+# Threads writing generated pages into the docs tree (see OutputBatch).
+# Overridable with OUTPUT_WRITE_WORKERS.
+OUTPUT_WRITE_WORKERS = int(os.environ.get("OUTPUT_WRITE_WORKERS", "4"))
+
+# `mkdocs serve` re-executes this module on every rebuild, so in-memory caches
+# are parked on a holder in sys.modules to survive reloads.
+_STATE = sys.modules.setdefault("_main_build_state", types.ModuleType("_main_build_state"))
+
+def _shared(name, factory=dict):
+    """Returns the in-memory cache `name`, creating it on first use."""
+    if not hasattr(_STATE, name):
+        setattr(_STATE, name, factory())
+    return getattr(_STATE, name)
+
+# --- DEPENDENCY TRACKING ---
+# One {path: fingerprint} dict per cached macro call (or incremental build
+# step) in progress; every input
+# read through the helpers below is recorded in all of them.
+_DEPENDENCIES = []
+
+def _path_fingerprint(path):
+    """Cheap change detector for a file or folder: (mtime, size), None if missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _track(path, fingerprint=None):
+    """
+    Records that the macro calls in progress read `path`. `fingerprint` is
+    its _path_fingerprint if the caller just took it, to spare a stat.
+    """
+    for dependencies in _DEPENDENCIES:
+        if path not in dependencies:
+            dependencies[path] = fingerprint or _path_fingerprint(path)
+
+# Inputs and result of the last run of every incremental build step, kept
+# across `mkdocs serve` reloads: (step, arguments) -> {'dependencies', 'result'}
+_STEPS = _shared("steps")
+
+def _changed_dependency(dependencies):
+    """Returns the first path whose fingerprint differs from the recorded one, or None."""
+    for path, fingerprint in dependencies.items():
+        if _path_fingerprint(path) != fingerprint:
+            return path
+    return None
+
+def incremental(func):
+    """
+    Makes a build step a node of the dependency graph: the step reruns only
+    when a file or folder it read (see _track) changed since its last run in
+    this process, otherwise its previous result is returned. This is what
+    keeps `mkdocs serve` rebuilds proportional to the edit: changing a blog
+    post does not regenerate the publication pages, and changing the bib
+    does not rebuild the image variants.
+
+    Inputs are fingerprinted after the step ran, so the files it writes into
+    folders it also reads (e.g. the generated pages) do not count as changes.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = repr((func.__name__, args, sorted(kwargs.items()), _CODE_DIGEST))
+        previous = _STEPS.get(key)
+        if previous is not None:
+            changed = _changed_dependency(previous['dependencies'])
+            if changed is None:
+                _count('cache_hits')
+                for path in previous['dependencies']:
+                    _track(path)
+                return previous['result']
+            log.debug(f"{func.__name__}: {changed} changed")
+
+        _DEPENDENCIES.append({})
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            dependencies = _DEPENDENCIES.pop()
+        dependencies = {path: _path_fingerprint(path) for path in dependencies}
+        for path, fingerprint in dependencies.items():
+            for outer in _DEPENDENCIES:
+                outer.setdefault(path, fingerprint)
+        if dependencies:
+            _STEPS[key] = {'dependencies': dependencies, 'result': result}
+        return result
+    return wrapper
+
+# --- INSTRUMENTATION ---
+# name -> {'calls', 'seconds', 'files_read', 'bytes_written', 'cache_hits'}
+_PROFILE = {}
+# Names of the profiled scopes currently running (counters go to all of them)
+_PROFILE_STACK = []
+
+def _count(counter, amount=1):
+    """Adds to a counter of every profiled scope in progress."""
+    for name in _PROFILE_STACK:
+        _PROFILE[name][counter] += amount
+
+@contextmanager
+def profiled_scope(name):
+    """Times a block as `name` when profiling is enabled (times are inclusive)."""
+    if not PROFILE_ENABLED:
+        yield
+        return
+    record = _PROFILE.setdefault(name, {
+        'calls': 0, 'seconds': 0.0, 'files_read': 0, 'bytes_written': 0, 'cache_hits': 0,
+    })
+    record['calls'] += 1
+    _PROFILE_STACK.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record['seconds'] += time.perf_counter() - start
+        _PROFILE_STACK.pop()
+
+def profiled(name=None):
+    """Decorator version of profiled_scope; defaults to the function's name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profiled_scope(name or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def write_profile_report():
+    """Writes the JSON report and logs a summary table of the recorded scopes."""
+    if not PROFILE_ENABLED or not _PROFILE:
+        return
+    report_file = os.path.join(CACHE_DIR or ".", PROFILE_REPORT)
+    os.makedirs(os.path.dirname(report_file), exist_ok=True)
+    with open(report_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'generated': datetime.datetime.now().isoformat(timespec='seconds'),
+            'scopes': _PROFILE,
+        }, f, indent=2, sort_keys=True)
+
+    rows = sorted(_PROFILE.items(), key=lambda item: item[1]['seconds'], reverse=True)
+    width = max(len(name) for name, _ in rows)
+    lines = [f"{'scope':<{width}} {'calls':>6} {'seconds':>9} {'read':>6} {'written':>10} {'hits':>6}"]
+    for name, r in rows:
+        lines.append(f"{name:<{width}} {r['calls']:>6} {r['seconds']:>9.3f} "
+                     f"{r['files_read']:>6} {r['bytes_written']:>10} {r['cache_hits']:>6}")
+    log.info("Build profile (%s):\n%s", report_file, "\n".join(lines))
+
+# In-memory parse results, shared by every caller during (and across) builds.
+# Maps absolute bib path -> {'mtime', 'size', 'digest', 'entries', 'index', 'indexes'}
+_BIB_CACHE = _shared("bib")
+# Where the entry of every record of the last cached parse of each bib file
+# was pickled, so that an edit only re-parses the records that changed:
+# absolute bib path -> {'cache_dir', 'records': {record digest: (chunk number, position)}}
+_BIB_RECORDS = _shared("bib_records")
+
+# Directory listings used instead of probing the filesystem per entry.
+# Maps (folder, extensions) -> (folder mtime, {stem: filename})
+_ASSET_INDEX = _shared("assets")
+
+def _scan_assets(folder, extensions):
+    """Lists `folder` once and maps each file stem to its best-ranked filename."""
+    rank = {ext: i for i, ext in enumerate(extensions)}
+    index = {}
+    with os.scandir(folder) as it:
+        for item in it:
+            stem, ext = os.path.splitext(item.name)
+            if ext not in rank or not item.is_file():
+                continue
+            current = index.get(stem)
+            if current is None or rank[ext] < rank[os.path.splitext(current)[1]]:
+                index[stem] = item.name
+    return index
+
+def _asset_index(folder, extensions):
+    """
+    Returns {stem: filename} for the files of `folder` with one of the given
+    extensions. The folder is scanned on first use and then served from memory
+    until refresh_asset_indexes() sees its mtime change.
+    """
+    _track(folder)
+    key = (folder, tuple(extensions))
+    cached = _ASSET_INDEX.get(key)
+    if cached is None:
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+        except OSError:
+            mtime, index = None, {}
+        else:
+            index = _scan_assets(folder, extensions)
+        cached = _ASSET_INDEX[key] = (mtime, index)
+    return cached[1]
+
+def _is_within(path, root):
+    path, root = os.path.abspath(path), os.path.abspath(root)
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+def refresh_asset_indexes(root=None):
+    """
+    Re-scans the indexed folders whose mtime changed (a file was added,
+    removed or renamed), only those under `root` if given. Called once per
+    build and after each OutputBatch; lookups never touch the disk.
+    """
+    for key, (mtime, _) in list(_ASSET_INDEX.items()):
+        folder, extensions = key
+        if root is not None and not _is_within(folder, root):
+            continue
+        try:
+            current = os.stat(folder).st_mtime_ns
+        except OSError:
+            _ASSET_INDEX[key] = (None, {})
+            continue
+        if current != mtime:
+            _ASSET_INDEX[key] = (current, _scan_assets(folder, extensions))
+
+# Content hashes of the local PDFs, persisted in CACHE_DIR/pdf-manifest.json.
+# Maps citation key -> {'source', 'mtime_ns', 'size', 'sha256'}
+_PDF_MANIFEST = _shared("pdfs")
+
+def _pdf_manifest_path():
+    return os.path.join(CACHE_DIR, "pdf-manifest.json") if CACHE_DIR else None
+
+def _load_pdf_manifest():
+    """Fills _PDF_MANIFEST from disk the first time it is needed in a process."""
+    if getattr(_STATE, "pdf_manifest_loaded", False):
+        return
+    _STATE.pdf_manifest_loaded = True
+    manifest_file = _pdf_manifest_path()
+    if not manifest_file or not os.path.exists(manifest_file):
+        return
+    _count('files_read')
+    try:
+        with open(manifest_file, encoding='utf-8') as f:
+            _PDF_MANIFEST.update(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+def _save_pdf_manifest():
+    manifest_file = _pdf_manifest_path()
+    if not manifest_file or not getattr(_STATE, "pdf_manifest_dirty", False):
+        return
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    tmp_file = manifest_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(_PDF_MANIFEST, f, indent=1, sort_keys=True)
+        _count('bytes_written', f.tell())
+    os.replace(tmp_file, manifest_file)
+    _STATE.pdf_manifest_dirty = False
+
+def _publication_pdf_record(citation_key):
+    """Returns the manifest record of the local PDF of a paper, hashing it if it changed."""
+    filename = _asset_index(PUB_PDF_DIR_ABS, ['.pdf']).get(citation_key)
+    if not filename:
+        return None
+    source = os.path.join(PUB_PDF_DIR_ABS, filename)
+    fingerprint = _path_fingerprint(source)
+    _track(source, fingerprint)
+    _load_pdf_manifest()
+    record = _PDF_MANIFEST.get(citation_key)
+    if (record is None or record['source'] != source or fingerprint is None
+            or (record['mtime_ns'], record['size']) != fingerprint):
+        if fingerprint is None:
+            return None
+        record = _PDF_MANIFEST[citation_key] = {
+            'source': source, 'mtime_ns': fingerprint[0], 'size': fingerprint[1],
+            'sha256': _file_digest(source),
+        }
+        _STATE.pdf_manifest_dirty = True
+    return record
+
+def _hashed_pdf_name(record):
+    return f"{record['sha256'][:16]}.pdf"
+
+def find_publication_pdf(citation_key):
+    """
+    Returns the content-hashed site URL of the local PDF of a paper, or None.
+    The PDF is looked up in the folder listing and stat'ed once per call, so
+    callers look it up once per entry and pass the URL along.
+    """
+    record = _publication_pdf_record(citation_key)
+    return f"/{PUB_PDF_HASHED_DIR_REL}/{_hashed_pdf_name(record)}" if record else None
+
+def _linearized_pdf(record):
+    """Returns a linearized copy of a PDF (cached by hash), or None without qpdf."""
+    qpdf = shutil.which("qpdf")
+    if not qpdf or not CACHE_DIR:
+        if not getattr(_STATE, "qpdf_warned", False):
+            log.warning("PDF_LINEARIZE=1 but qpdf is not installed; publishing PDFs as they are")
+            _STATE.qpdf_warned = True
+        return None
+    target = os.path.join(CACHE_DIR, "pdfs", _hashed_pdf_name(record))
+    if os.path.exists(target):
+        _count('cache_hits')
+        return target
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp_file = target + ".tmp"
+    # Exit status 3 means qpdf succeeded with warnings
+    result = subprocess.run([qpdf, "--linearize", record['source'], tmp_file], capture_output=True)
+    if result.returncode not in (0, 3):
+        log.warning("qpdf could not linearize %s: %s", record['source'],
+                    result.stderr.decode(errors='replace').strip())
+        return None
+    os.replace(tmp_file, target)
+    return target
+
+def publish_publication_pdfs(site_dir):
+    """
+    Writes one content-hashed copy of every distinct local PDF into the
+    built site (see PUB_PDF_HASHED_DIR_REL) and saves the PDF manifest.
+    """
+    index = _asset_index(PUB_PDF_DIR_ABS, ['.pdf'])
+    target_dir = os.path.join(site_dir, PUB_PDF_HASHED_DIR_REL)
+    os.makedirs(target_dir, exist_ok=True)
+    published = set()
+    for citation_key in sorted(index):
+        record = _publication_pdf_record(citation_key)
+        if record is None:
+            continue
+        name = _hashed_pdf_name(record)
+        target = os.path.join(target_dir, name)
+        if name in published or os.path.exists(target):
+            published.add(name)
+            continue
+        published.add(name)
+        # Linking the copy mkdocs made lets the deploy archive store it once
+        site_copy = os.path.join(site_dir, PUB_PDF_DIR_REL, os.path.basename(record['source']))
+        source = ((PUB_PDF_LINEARIZE and _linearized_pdf(record))
+                  or (site_copy if os.path.exists(site_copy) else record['source']))
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+            _count('bytes_written', record['size'])
+
+    if not PUB_PDF_KEEP_ORIGINALS:
+        shutil.rmtree(os.path.join(site_dir, PUB_PDF_DIR_REL), ignore_errors=True)
+
+    # Forget files that were removed from the PDF folder
+    for citation_key in list(_PDF_MANIFEST):
+        if citation_key not in index:
+            del _PDF_MANIFEST[citation_key]
+            _STATE.pdf_manifest_dirty = True
+    _save_pdf_manifest()
+
+# --- IMAGE VARIANTS ---
+# Variants of each publication image, kept across `mkdocs serve` reloads.
+# Maps source path -> ((mtime_ns, size), info), see publication_image()
+_IMAGE_VARIANTS = _shared("images")
+
+def _image_cache_dir(digest):
+    return os.path.join(CACHE_DIR or ".cache/main", "images", digest)
+
+def _image_formats():
+    return [fmt for fmt in PUB_IMAGE_FORMATS if features.check(fmt)]
+
+def _build_image_variants(source):
+    """
+    Returns the info of the variants of `source`, encoding the missing ones:
+    {'digest', 'width', 'height', 'sources': {format: [(width, filename)]}}.
+    Variants are stored in a folder named after the source hash, so an
+    unchanged image is never decoded again.
+    """
+    digest = _file_digest(source)
+    cache_dir = _image_cache_dir(digest)
+    info_file = os.path.join(cache_dir, "info.json")
+    formats = _image_formats()
+    try:
+        with open(info_file, encoding='utf-8') as f:
+            info = json.load(f)
+        if info.get('widths') == PUB_IMAGE_WIDTHS and info.get('formats') == formats:
+            _count('cache_hits')
+            return info
+    except (OSError, ValueError):
+        pass
+
+    os.makedirs(cache_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    with Image.open(source) as image:
+        image.load()
+        width, height = image.size
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        sizes = [w for w in PUB_IMAGE_WIDTHS if w < width] or [width]
+        sources = {}
+        for target in sizes:
+            resized = image if target == width else image.resize(
+                (target, round(height * target / width)), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                filename = f"{stem}-{digest[:10]}-{target}.{fmt}"
+                with open(os.path.join(cache_dir, filename), 'wb') as f:
+                    resized.save(f, fmt.upper(), **PUB_IMAGE_FORMATS[fmt])
+                    _count('bytes_written', f.tell())
+                sources.setdefault(fmt, []).append((target, filename))
+
+    info = {'digest': digest, 'width': width, 'height': height, 'sources': sources,
+            'widths': PUB_IMAGE_WIDTHS, 'formats': formats}
+    with open(info_file, 'w', encoding='utf-8') as f:
+        json.dump(info, f)
+    return info
+
+@profiled()
+@incremental
+def prepare_publication_images():
+    """
+    Brings the variants of every publication image up to date. Images are
+    encoded in a thread pool (Pillow releases the GIL while resizing and
+    encoding), so they spread across all cores.
+    """
+    index = _asset_index(PUB_IMAGE_DIR_ABS, PUB_IMAGE_EXTENSIONS)
+    stale = []
+    for filename in index.values():
+        source = os.path.join(PUB_IMAGE_DIR_ABS, filename)
+        fingerprint = _path_fingerprint(source)
+        _track(source, fingerprint)
+        cached = _IMAGE_VARIANTS.get(source)
+        if cached is None or cached[0] != fingerprint:
+            stale.append((source, fingerprint))
+    if not stale:
+        return
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+        infos = pool.map(lambda job: _build_image_variants(job[0]), stale)
+        for (source, fingerprint), info in zip(stale, infos):
+            _IMAGE_VARIANTS[source] = (fingerprint, info)
+
+def publication_image(citation_key):
+    """
+    Returns what a page needs to display the image of a paper, or None:
+    {'src', 'width', 'height', 'sources': {format: [(width, url)]}}.
+    """
+    filename = _asset_index(PUB_IMAGE_DIR_ABS, PUB_IMAGE_EXTENSIONS).get(citation_key)
+    if not filename:
+        return None
+    source = os.path.join(PUB_IMAGE_DIR_ABS, filename)
+    fingerprint = _path_fingerprint(source)
+    _track(source, fingerprint)
+    cached = _IMAGE_VARIANTS.get(source)
+    if cached is None or cached[0] != fingerprint:
+        cached = _IMAGE_VARIANTS[source] = (fingerprint, _build_image_variants(source))
+    info = cached[1]
+    return {
+        'src': f"/{PUB_IMAGE_DIR_REL}/{filename}",
+        'width': info['width'],
+        'height': info['height'],
+        'sources': {fmt: [(w, f"/{PUB_IMAGE_VARIANT_DIR_REL}/{name}") for w, name in variants]
+                    for fmt, variants in info['sources'].items()},
+    }
+
+def copy_publication_images(site_dir):
+    """Copies the variants of the current images into the built site."""
+    target_dir = os.path.join(site_dir, PUB_IMAGE_VARIANT_DIR_REL)
+    os.makedirs(target_dir, exist_ok=True)
+    for _, info in list(_IMAGE_VARIANTS.values()):
+        for variants in info['sources'].values():
+            for _, filename in variants:
+                target = os.path.join(target_dir, filename)
+                # Names contain the source hash: an existing file is current
+                if not os.path.exists(target):
+                    shutil.copyfile(os.path.join(_image_cache_dir(info['digest']), filename), target)
+                    _count('bytes_written', os.path.getsize(target))
+
+# Parsed frontmatter headers shared by every macro.
+# Maps Markdown path -> (mtime, metadata dict)
+_METADATA_CACHE = _shared("frontmatter")
+# Markdown files of each folder, listed once per build:
+# (folder, recursive) -> ([paths], [folders listed])
+_FOLDER_LISTINGS = {}
+
+_FM_BOUNDARY_RE = re.compile(r'^-{3,}\s*$')
+_FM_HANDLER = frontmatter.YAMLHandler()
+
+def _read_frontmatter(filepath):
+    """
+    Parses the YAML header of a Markdown file. Reading stops at the closing
+    '---', so the body of the post is never loaded. Decoded like MkDocs reads
+    pages (utf-8-sig), so a byte order mark does not hide the header.
+    """
+    _count('files_read')
+    header = []
+    with open(filepath, encoding='utf-8-sig') as f:
+        line = f.readline()
+        while line and not line.strip():
+            line = f.readline()
+        if not _FM_BOUNDARY_RE.match(line):
+            return {}
+        for line in f:
+            if _FM_BOUNDARY_RE.match(line):
+                break
+            header.append(line)
+        else:
+            # Unterminated header: python-frontmatter doesn't treat it as metadata either
+            return {}
+    with profiled_scope("frontmatter"):
+        metadata = _FM_HANDLER.load("".join(header))
+    return metadata if isinstance(metadata, dict) else {}
+
+def get_metadata(filepath):
+    """
+    Returns the frontmatter of a Markdown file as a dict. Headers are parsed
+    once and reused until the file's mtime changes.
+    """
+    _track(filepath)
+    mtime = os.stat(filepath).st_mtime_ns
+    cached = _METADATA_CACHE.get(filepath)
+    if cached and cached[0] == mtime:
+        _count('cache_hits')
+        return cached[1]
+    metadata = _read_frontmatter(filepath)
+    _METADATA_CACHE[filepath] = (mtime, metadata)
+    return metadata
+
+def list_markdown_files(folder, recursive=False):
+    """
+    Returns the Markdown files of `folder` (and its subfolders if `recursive`),
+    skipping index.md. Each folder is listed once per build.
+    """
+    key = (folder, recursive)
+    if key not in _FOLDER_LISTINGS:
+        if recursive:
+            walk = list(os.walk(folder))
+        else:
+            walk = [(folder, None, os.listdir(folder))]
+        paths = [
+            os.path.join(root, filename)
+            for root, _, files in walk
+            for filename in files
+            if filename.endswith(".md") and filename != "index.md"
+        ]
+        _FOLDER_LISTINGS[key] = (paths, [root for root, _, _ in walk])
+
+    paths, folders = _FOLDER_LISTINGS[key]
+    # A folder's mtime changes when files are added, removed or renamed in it
+    for listed in folders:
+        _track(listed)
+    return paths
+
+def _file_digest(path):
+    """Returns the sha256 hex digest of a file, read in chunks."""
+    _count('files_read')
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _fields_digest(fields):
+    """
+    sha1 of the sorted items of a dict (a bib entry or a frontmatter dict).
+    Unlike hash(), it is the same in every process, so it can be persisted.
+    """
+    return hashlib.sha1(repr(sorted(fields.items())).encode('utf-8')).digest()
+
+# Start of a '@type{' (or '@type(') record
+_BIB_RECORD_RE = re.compile(r'\s*@\s*(\w+)\s*([{(])')
+
+def _iter_bib_records(bib_file):
+    """
+    Splits a .bib file into the raw text of its '@type{...}' records without
+    parsing them. The file is read line by line and only the current record is
+    held in memory. Text between records is a comment in BibTeX and is skipped.
+    """
+    record = []
+    depth = 0
+    opener = closer = None
+    _count('files_read')
+    with open(bib_file, encoding='utf-8') as f:
+        for line in f:
+            if not record:
+                match = _BIB_RECORD_RE.match(line)
+                if not match:
+                    continue
+                opener = match.group(2)
+                closer = '}' if opener == '{' else ')'
+                depth = 0
+            record.append(line)
+            # Escaped braces (\{ and \}) are literal characters, not delimiters
+            depth += (line.count(opener) - line.count('\\' + opener)) \
+                - (line.count(closer) - line.count('\\' + closer))
+            if depth <= 0:
+                yield "".join(record)
+                record = []
+    if record:
+        yield "".join(record)
+
+def _parse_bib_chunks(bib_file, chunk_size, cache_dir=None):
+    """
+    Parses a .bib file `chunk_size` records at a time and yields each chunk's
+    entries (file order). @string definitions carry over between chunks since a
+    single parser, and therefore a single string table, is reused.
+
+    Records unchanged since the last cached parse of the file (same text, same
+    @string definitions before them) are not parsed again but read back from
+    that parse's chunks. With `cache_dir` (where the yielded chunks are being
+    pickled, numbered from 0), the location of every entry is remembered for
+    the next parse; only digests and positions stay in memory (and are saved
+    next to the chunks, see _stored_bib_records).
+    """
+    path = os.path.abspath(bib_file)
+    parser = bibtexparser.bparser.BibTexParser()
+    parser.expect_multiple_parse = True
+    previous = _BIB_RECORDS.get(path)
+    if previous is None and cache_dir:
+        # First parse in this process: start from the one saved on disk
+        previous = _stored_bib_records(cache_dir)
+    reuse = _previous_bib_records(previous or {})
+    current = {}
+    number = 0
+    # Digest of the @string/@preamble records seen so far
+    context = hashlib.sha1()
+    pending = []
+    for record in _iter_bib_records(bib_file):
+        kind = _BIB_RECORD_RE.match(record).group(1).lower()
+        if kind in ('string', 'preamble', 'comment'):
+            context.update(record.encode('utf-8'))
+            pending.append((None, record))
+        else:
+            digest = hashlib.sha1(context.digest() + record.encode('utf-8')).digest()
+            pending.append((digest, record))
+        if len(pending) >= chunk_size:
+            yield _parse_bib_records(parser, pending, reuse, current, number)
+            pending = []
+            number += 1
+    if pending:
+        yield _parse_bib_records(parser, pending, reuse, current, number)
+    if cache_dir:
+        _BIB_RECORDS[path] = {'cache_dir': cache_dir, 'records': current}
+
+def _previous_bib_records(previous):
+    """
+    Returns a function that gives the entry of a record digest from the chunks
+    of a previous parse (see _BIB_RECORDS), or None. Chunks are read on demand
+    and only the last one read is held.
+    """
+    records = previous.get('records') or {}
+    cache_dir = previous.get('cache_dir')
+    loaded = {}
+
+    def reuse(digest):
+        location = records.get(digest)
+        if location is None:
+            return None
+        number, position = location
+        if number not in loaded:
+            loaded.clear()
+            _count('files_read')
+            try:
+                with open(os.path.join(cache_dir, f"chunk-{number:05d}.pickle"), 'rb') as f:
+                    loaded[number] = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                loaded[number] = []
+        entries = loaded[number]
+        return entries[position] if position < len(entries) else None
+    return reuse
+
+def _parse_bib_records(parser, records, reuse, current, number):
+    """
+    Returns the entries of [(digest, record text)] (digest None for @string
+    and other directives), parsing only the records `reuse` has no entry for.
+    The position of every entry in chunk `number` is recorded in `current`.
+    """
+    reused = {}
+    todo = []
+    for digest, record in records:
+        entry = reuse(digest) if digest is not None else None
+        if entry is None:
+            todo.append((digest, record))
+        else:
+            reused[digest] = entry
+    parsed = []
+    if todo:
+        with profiled_scope("bibtexparser"):
+            db = parser.parse("".join(record for _, record in todo))
+        parsed = db.entries
+        db.entries = []
+        db.comments = []
+
+    new = [digest for digest, _ in todo if digest is not None]
+    if len(parsed) != len(new):
+        # A record that did not parse into exactly one entry: the entries
+        # cannot be matched to their records, parse the chunk as a whole
+        with profiled_scope("bibtexparser"):
+            db = parser.parse("".join(record for _, record in records))
+        entries = db.entries
+        db.entries = []
+        db.comments = []
+        return entries
+
+    fresh = dict(zip(new, parsed))
+    entries = []
+    for digest, _ in records:
+        if digest is None:
+            continue
+        entry = fresh.get(digest) or reused[digest]
+        current[digest] = (number, len(entries))
+        entries.append(entry)
+    return entries
+
+def _year_sort_key(entry):
+    return entry.get('year', '0')
+
+def _bib_cache_dir(bib_file, digest):
+    name = os.path.splitext(os.path.basename(bib_file))[0]
+    version = f"v{BIB_CACHE_VERSION}-{bibtexparser.__version__}"
+    return os.path.join(CACHE_DIR, "bib", name, f"{version}-{digest}")
+
+def _stored_bib_records(cache_dir):
+    """
+    Returns the _BIB_RECORDS record of the completed cached parse next to
+    `cache_dir` (an older content of the same bib file, by the same cache
+    version), from the records.pickle written by _write_bib_chunks, or None.
+    This lets the first edit after a restart re-parse only what changed.
+    """
+    parent = os.path.dirname(cache_dir)
+    prefix = os.path.basename(cache_dir).rsplit("-", 1)[0] + "-"
+    try:
+        names = sorted(os.listdir(parent))
+    except OSError:
+        return None
+    for name in names:
+        if not name.startswith(prefix) or name.endswith(".tmp"):
+            continue
+        records_file = os.path.join(parent, name, "records.pickle")
+        if not os.path.exists(records_file):
+            continue
+        _count('files_read')
+        try:
+            with open(records_file, 'rb') as f:
+                return {'cache_dir': os.path.join(parent, name), 'records': pickle.load(f)}
+        except (OSError, pickle.UnpicklingError, EOFError):
+            continue
+    return None
+
+def _bib_state(bib_file):
+    """
+    Returns the in-memory record of a bib file, refreshed for its current
+    content: ({'mtime', 'size', 'digest', 'entries', 'index', 'indexes'},
+    path). All but the first three are only filled in once someone asked for them.
+    """
+    path = os.path.abspath(bib_file)
+    _track(path)
+    stat = os.stat(path)
+    enrichment = _enrichment_records()[0]
+    cached = _BIB_CACHE.get(path)
+    if (cached and cached['mtime'] == stat.st_mtime_ns and cached['size'] == stat.st_size
+            and cached.get('enrichment') == enrichment):
+        _count('cache_hits')
+        return cached, path
+
+    # mtime changed (or first call): only drop parsed data if the content did too.
+    # The parse cache on disk does not depend on the enrichment, only the
+    # entries derived from it do.
+    digest = _file_digest(path)
+    if not cached or cached['digest'] != digest or cached.get('enrichment') != enrichment:
+        cached = {'digest': digest, 'entries': None, 'index': None, 'indexes': None}
+    cached['enrichment'] = enrichment
+    cached['mtime'] = stat.st_mtime_ns
+    cached['size'] = stat.st_size
+    _BIB_CACHE[path] = cached
+    return cached, path
+
+def _write_bib_chunks(path, digest, chunk_size):
+    """
+    Streams the parse of `path` into pickled chunks under CACHE_DIR, yielding
+    every chunk as soon as it is parsed. The cache folder only appears (and
+    older snapshots of the same file are dropped) once the parse completed.
+    """
+    cache_dir = _bib_cache_dir(path, digest)
+    tmp_dir = cache_dir + ".tmp"
+    if os.path.isdir(tmp_dir):
+        shutil.rmtree(tmp_dir)
+    os.makedirs(tmp_dir)
+
+    index = []
+    completed = False
+    try:
+        for number, entries in enumerate(_parse_bib_chunks(path, chunk_size, cache_dir)):
+            with open(os.path.join(tmp_dir, f"chunk-{number:05d}.pickle"), 'wb') as f:
+                pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+                _count('bytes_written', f.tell())
+            index.extend((_year_sort_key(entry), entry.get('ID')) for entry in entries)
+            yield entries
+        with open(os.path.join(tmp_dir, "index.pickle"), 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _count('bytes_written', f.tell())
+        with open(os.path.join(tmp_dir, "records.pickle"), 'wb') as f:
+            pickle.dump(_BIB_RECORDS[os.path.abspath(path)]['records'], f, protocol=pickle.HIGHEST_PROTOCOL)
+            _count('bytes_written', f.tell())
+        completed = True
+    finally:
+        if not completed:
+            # The consumer stopped early: a partial cache is worthless
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # Only the latest snapshot of a bib file is worth keeping
+    parent = os.path.dirname(cache_dir)
+    for old in os.listdir(parent):
+        old_path = os.path.join(parent, old)
+        if old_path != tmp_dir:
+            shutil.rmtree(old_path, ignore_errors=True)
+    os.replace(tmp_dir, cache_dir)
+
+def _read_bib_chunks(cache_dir):
+    """Yields the pickled chunks of a completed cache folder, in file order."""
+    for name in sorted(os.listdir(cache_dir)):
+        if name.startswith("chunk-"):
+            _count('files_read')
+            _count('cache_hits')
+            with open(os.path.join(cache_dir, name), 'rb') as f:
+                yield pickle.load(f)
+
+def iter_bib_entries(bib_file, chunk_size=None):
+    """
+    Yields the entries of a BibTeX file in bounded chunks (lists of at most
+    `chunk_size` entries, default BIB_CHUNK_SIZE), without holding the whole
+    bibliography in memory.
+
+    Each distinct file content is parsed once: the stream is pickled chunk by
+    chunk under CACHE_DIR and later calls replay those chunks. If the entries
+    are already in memory (load_bib_data was called) they are served from there.
+    """
+    if not os.path.exists(bib_file):
+        return
+    chunk_size = chunk_size or BIB_CHUNK_SIZE
+    state, path = _bib_state(bib_file)
+
+    if state['entries'] is not None or not CACHE_DIR:
+        entries = load_bib_data(bib_file)
+        for i in range(0, len(entries), chunk_size):
+            yield entries[i:i + chunk_size]
+        return
+
+    cache_dir = _bib_cache_dir(path, state['digest'])
+    if os.path.exists(os.path.join(cache_dir, "index.pickle")):
+        chunks = _read_bib_chunks(cache_dir)
+    else:
+        chunks = _write_bib_chunks(path, state['digest'], BIB_CHUNK_SIZE)
+    for entries in map(_apply_enrichment, chunks):
+        for i in range(0, len(entries), chunk_size):
+            yield entries[i:i + chunk_size]
+
+def load_bib_index(bib_file):
+    """
+    Returns a lightweight [(year, citation_key)] list sorted by year (newest
+    first, file order within a year) - the order of load_bib_data - without
+    materializing the entries when the parse is already cached on disk.
+    """
+    if not os.path.exists(bib_file):
+        return []
+    state, path = _bib_state(bib_file)
+    if state['index'] is None:
+        if state['entries'] is not None or not CACHE_DIR:
+            index = [(_year_sort_key(entry), entry.get('ID')) for entry in load_bib_data(bib_file)]
+        else:
+            index_file = os.path.join(_bib_cache_dir(path, state['digest']), "index.pickle")
+            if not os.path.exists(index_file):
+                # Drain the stream once to populate the cache
+                for _ in iter_bib_entries(bib_file):
+                    pass
+            _count('files_read')
+            with open(index_file, 'rb') as f:
+                index = pickle.load(f)
+        state['index'] = sorted(index, key=lambda item: item[0], reverse=True)
+    return state['index']
 
 def load_bib_data(bib_file):
+    """
+    Returns the BibTeX entries sorted by year (newest first).
+
+    The file is parsed at most once per content: results are kept in memory
+    keyed on the file's mtime/size and on disk (CACHE_DIR) keyed on its sha256,
+    so every caller of a build - and every `mkdocs serve` reload - shares the
+    same list. Treat the returned entries as read-only.
+    """
     if not os.path.exists(bib_file):
         return []
-    with open(bib_file, encoding='utf-8') as bibtex_file:
-        bib_database = bibtexparser.load(bibtex_file)
-    return sorted(bib_database.entries, key=lambda x: x.get('year', '0'), reverse=True)
+
+    state, path = _bib_state(bib_file)
+    if state['entries'] is None:
+        if CACHE_DIR:
+            chunks = iter_bib_entries(bib_file)
+        else:
+            chunks = map(_apply_enrichment, _parse_bib_chunks(path, BIB_CHUNK_SIZE))
+        entries = [entry for chunk in chunks for entry in chunk]
+        # sorted() is stable: within a year, entries keep their file order
+        state['entries'] = sorted(entries, key=_year_sort_key, reverse=True)
+    return state['entries']
+
+# --- METADATA ENRICHMENT ---
+# Records of ENRICHMENT_CACHE, reloaded when the file changes.
+# {'fingerprint': (mtime_ns, size) or None, 'records': {lookup key: record}}
+_ENRICHMENT = _shared("enrichment")
+# Fields an enrichment record may fill in (never overwrite)
+ENRICHED_FIELDS = ['abstract', 'journal', 'doi']
+
+def _enrichment_records():
+    """Returns (fingerprint, {lookup key: record}) of ENRICHMENT_CACHE."""
+    _track(ENRICHMENT_CACHE)
+    fingerprint = _path_fingerprint(ENRICHMENT_CACHE)
+    if _ENRICHMENT.get('fingerprint') != fingerprint or 'records' not in _ENRICHMENT:
+        records = {}
+        if fingerprint is not None:
+            _count('files_read')
+            try:
+                with open(ENRICHMENT_CACHE, encoding='utf-8') as f:
+                    records = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning("Ignoring unreadable %s: %s", ENRICHMENT_CACHE, e)
+        _ENRICHMENT['fingerprint'] = fingerprint
+        _ENRICHMENT['records'] = records
+    return _ENRICHMENT['fingerprint'], _ENRICHMENT['records']
+
+def _arxiv_id(entry):
+    """Returns the arXiv identifier of an entry (eprint/arxiv field or arxiv.org URL), or None."""
+    value = entry.get('arxiv') or entry.get('eprint')
+    if not value:
+        url = entry.get('url') or entry.get('link') or ""
+        if "arxiv.org" not in url:
+            return None
+        value = url
+    match = re.search(r'(\d{4}\.\d{4,5}|[a-z\-]+(?:\.[A-Z]{2})?/\d{7})(?:v\d+)?(?:\.pdf)?/?$', value.strip())
+    return match.group(1) if match else None
+
+def _enrichment_keys(entry):
+    """Lookup keys of an entry in ENRICHMENT_CACHE, most authoritative first."""
+    keys = []
+    doi = entry.get('doi')
+    if doi:
+        keys.append("doi:" + re.sub(r'^https?://(dx\.)?doi\.org/', '', doi.strip()).lower())
+    arxiv_id = _arxiv_id(entry)
+    if arxiv_id:
+        keys.append("arxiv:" + arxiv_id)
+    return keys
+
+def _apply_enrichment(entries):
+    """Returns the entries with missing ENRICHED_FIELDS filled in from the cache."""
+    records = _enrichment_records()[1]
+    if not records:
+        return entries
+    enriched = []
+    for entry in entries:
+        missing = {}
+        for key in _enrichment_keys(entry):
+            fields = (records.get(key) or {}).get('fields') or {}
+            for field in ENRICHED_FIELDS:
+                if fields.get(field) and not entry.get(field) and field not in missing:
+                    # A booktitle is a venue too
+                    if field == 'journal' and entry.get('booktitle'):
+                        continue
+                    missing[field] = fields[field]
+        enriched.append(dict(entry, **missing) if missing else entry)
+    return enriched
+
+def _fetch_url(url, timeout):
+    """Blocking GET; returns (status, body bytes). Runs in the fetcher's threads."""
+    request = urllib.request.Request(url, headers={
+        'User-Agent': "personal-site-metadata-enrichment/1.0",
+        'Accept': "application/json, application/atom+xml;q=0.9",
+    })
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, b""
+
+def _crossref_fields(body):
+    message = json.loads(body).get('message', {})
+    fields = {}
+    abstract = message.get('abstract')
+    if abstract:
+        # Crossref abstracts are JATS XML fragments
+        abstract = re.sub(r'<jats:title>.*?</jats:title>', '', abstract, flags=re.S)
+        fields['abstract'] = " ".join(re.sub(r'<[^>]+>', ' ', abstract).split())
+    venue = (message.get('container-title') or [None])[0]
+    if venue:
+        fields['journal'] = venue
+    if message.get('DOI'):
+        fields['doi'] = message['DOI']
+    return fields
+
+_ATOM = {'atom': "http://www.w3.org/2005/Atom", 'arxiv': "http://arxiv.org/schemas/atom"}
+
+def _arxiv_fields(body):
+    """Returns {arxiv id: fields} for the entries of an arXiv API (Atom) response."""
+    results = {}
+    for item in ElementTree.fromstring(body).findall('atom:entry', _ATOM):
+        link = item.findtext('atom:id', '', _ATOM)
+        arxiv_id = _arxiv_id({'url': link})
+        if not arxiv_id:
+            continue
+        fields = {}
+        summary = item.findtext('atom:summary', '', _ATOM)
+        if summary.strip():
+            fields['abstract'] = " ".join(summary.split())
+        journal_ref = item.findtext('arxiv:journal_ref', '', _ATOM)
+        if journal_ref.strip():
+            fields['journal'] = " ".join(journal_ref.split())
+        doi = item.findtext('arxiv:doi', '', _ATOM)
+        if doi.strip():
+            fields['doi'] = doi.strip()
+        results[arxiv_id] = fields
+    return results
+
+async def _enrich(lookups, concurrency, timeout):
+    """
+    Fetches the lookup keys ("doi:..." / "arxiv:...") with at most
+    `concurrency` requests in flight and returns {key: record}. arXiv ids are
+    queried in batches. Failures are recorded too, so they are not retried
+    on every run.
+    """
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    records = {}
+    now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+
+    async def get(url):
+        async with limit:
+            return await loop.run_in_executor(pool, _fetch_url, url, timeout)
+
+    async def doi_job(key):
+        url = ENRICH_CROSSREF_URL + urllib.parse.quote(key[4:], safe="/")
+        try:
+            status, body = await get(url)
+            fields = _crossref_fields(body) if status == 200 else {}
+        except (OSError, ValueError) as e:
+            log.warning("%s: %s", key, e)
+            return
+        records[key] = {'status': status, 'fetched': now, 'fields': fields}
+
+    async def arxiv_job(keys):
+        ids = [key[6:] for key in keys]
+        url = ENRICH_ARXIV_URL + "?" + urllib.parse.urlencode(
+            {'id_list': ",".join(ids), 'max_results': len(ids)})
+        try:
+            status, body = await get(url)
+            found = _arxiv_fields(body) if status == 200 else {}
+        except (OSError, ValueError, ElementTree.ParseError) as e:
+            log.warning("arXiv batch %s...: %s", ids[0], e)
+            return
+        for key, arxiv_id in zip(keys, ids):
+            fields = found.get(arxiv_id)
+            records[key] = {'status': status if fields is not None else 404, 'fetched': now,
+                            'fields': fields or {}}
+
+    dois = [key for key in lookups if key.startswith("doi:")]
+    arxiv = [key for key in lookups if key.startswith("arxiv:")]
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        jobs = [doi_job(key) for key in dois]
+        jobs += [arxiv_job(arxiv[i:i + 50]) for i in range(0, len(arxiv), 50)]
+        await asyncio.gather(*jobs)
+    return records
+
+def enrich_bibliography(bib_file=BIB_FILE, refresh=False, retry_failed=False,
+                        concurrency=ENRICH_CONCURRENCY, timeout=ENRICH_TIMEOUT):
+    """
+    Looks up the DOI / arXiv metadata of the entries that miss one of the
+    ENRICHED_FIELDS and merges the responses into ENRICHMENT_CACHE. Cached
+    lookups are skipped unless `refresh` (or `retry_failed` for failures).
+    Returns the number of lookups made.
+    """
+    _, existing = _enrichment_records()
+    records = dict(existing)
+    lookups = []
+    for chunk in _parse_bib_chunks(os.path.abspath(bib_file), BIB_CHUNK_SIZE):
+        for entry in chunk:
+            if all(entry.get(field) for field in ENRICHED_FIELDS):
+                continue
+            for key in _enrichment_keys(entry):
+                record = records.get(key)
+                if (record is None or refresh or (retry_failed and record.get('status') != 200)) \
+                        and key not in lookups:
+                    lookups.append(key)
+    if not lookups:
+        return 0
+
+    try:
+        records.update(asyncio.run(_enrich(lookups, concurrency, timeout)))
+    finally:
+        tmp_file = ENRICHMENT_CACHE + ".tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=1, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
+        os.replace(tmp_file, ENRICHMENT_CACHE)
+    return len(lookups)
 
 def clean_text(text):
     """Cleans BibTeX braces and newlines."""
     if not text: return ""
     return text.replace("{", "").replace("}", "").replace('\n', ' ').strip()
 
-def format_authors(entry):
-    raw_authors = entry.get('author', 'Unknown').replace('\n', ' ')
-    formatted_authors = []
-    for name in raw_authors.split(' and '):
-        parts = name.split(',', 1)
-        if len(parts) == 2:
-            formatted_authors.append(f"{parts[1].strip()} {parts[0].strip()}")
-        else:
-            formatted_authors.append(name.strip())
-    return ", ".join(formatted_authors)
-
-def _slugify(text):
+# --- AUTHOR NAMES ---
+# Distinct author fields / names memoized by the parsers below. Co-authors
+# repeat across a bibliography, so most lookups are hits.
+AUTHOR_CACHE_SIZE = 16384
+
+# Combining marks of the LaTeX accent commands
+_LATEX_ACCENTS = {
+    "'": '\u0301', '`': '\u0300', '^': '\u0302', '"': '\u0308', '~': '\u0303',
+    '=': '\u0304', '.': '\u0307', 'u': '\u0306', 'v': '\u030c', 'H': '\u030b',
+    'c': '\u0327', 'k': '\u0328', 'r': '\u030a', 'd': '\u0323', 'b': '\u0331',
+}
+_LATEX_SYMBOLS = {
+    'ss': '\u00df', 'o': '\u00f8', 'O': '\u00d8', 'aa': '\u00e5', 'AA': '\u00c5',
+    'ae': '\u00e6', 'AE': '\u00c6', 'oe': '\u0153', 'OE': '\u0152',
+    'l': '\u0142', 'L': '\u0141', 'i': '\u0131', 'j': '\u0237',
+}
+# \'e, \'{e}, {\'e}, \'\i, \c{c}, \v s ...
+_LATEX_ACCENT_RE = re.compile(
+    r"\\([`'^\"~=.])\s*(\{\s*\\?[A-Za-z]\s*\}|\\[ij](?![A-Za-z])\s*|[A-Za-z])"
+    r"|\\([uvHckrdb])(?:\s*(\{\s*\\?[A-Za-z]\s*\})|\s+([A-Za-z]))"
+)
+_LATEX_SYMBOL_RE = re.compile(r"\\(ss|aa|AA|ae|AE|oe|OE|o|O|l|L|i|j)(?![A-Za-z])\s*")
+
+def _latex_accent(match):
+    command = match.group(1) or match.group(3)
+    letter = (match.group(2) or match.group(4) or match.group(5)).strip('{} ')
+    if letter.startswith('\\'):
+        letter = _LATEX_SYMBOLS.get(letter[1:], letter[1:])
+    # Dotless i/j only exist to carry an accent
+    letter = {'\u0131': 'i', '\u0237': 'j'}.get(letter, letter)
+    return unicodedata.normalize('NFC', letter + _LATEX_ACCENTS[command])
+
+@functools.lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def latex_to_unicode(text):
+    """Turns LaTeX accents and letters into Unicode and drops the braces."""
+    if '\\' in text:
+        text = _LATEX_ACCENT_RE.sub(_latex_accent, text)
+        text = _LATEX_SYMBOL_RE.sub(lambda m: _LATEX_SYMBOLS[m.group(1)], text)
+        text = text.replace('\\&', '&')
+    text = re.sub(r'(?<!\\)~', ' ', text)
+    return " ".join(text.replace("{", "").replace("}", "").split())
+
+def _split_top_level(text, separator):
     """
-    Simple slugify function to match MkDocs behavior.
-    Converts 'Title - Subtitle' to 'title---subtitle'.
+    Splits `text` on `separator` (a character, or None for whitespace and
+    ties) outside of braces. Returns the non-empty stripped parts.
     """
-    text = text.lower()
-    # Remove characters that aren't alphanumerics, underscores, hyphens, or spaces
-    text = re.sub(r'[^\w\s-]', '', text)
-    # Replace spaces with hyphens
-    text = text.strip().replace(' ', '-')
-    return text
+    if '{' not in text:
+        if separator is None:
+            return [part for part in re.split(r'(?<!\\)[\s~]+', text) if part]
+        return [part.strip() for part in text.split(separator)]
+    parts, current, depth = [], [], 0
+    for char in text:
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        elif depth == 0 and (char == separator or (separator is None and (char.isspace() or char == '~'))):
+            parts.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current).strip())
+    return [part for part in parts if part] if separator is None else parts
+
+def _is_lowercase_word(word):
+    """
+    BibTeX's test for "von" words: the first letter at brace depth 0 is
+    lowercase. A leading {\\'e}-style special character counts by its letter;
+    any other braced group makes the word caseless (never "von").
+    """
+    depth = 0
+    for i, char in enumerate(word):
+        if char == '{':
+            if depth == 0 and word[i + 1:i + 2] == '\\':
+                letters = latex_to_unicode(word[i:])
+                return bool(letters) and letters[0].islower()
+            depth += 1
+        elif char == '}':
+            depth -= 1
+        elif depth == 0 and char.isalpha():
+            return char.islower()
+    return False
+
+def _split_von_last(words):
+    """Splits "von Last" words: von runs up to the last lowercase word before the final one."""
+    von_end = 0
+    for i, word in enumerate(words[:-1]):
+        if _is_lowercase_word(word):
+            von_end = i + 1
+    return words[:von_end], words[von_end:]
+
+@functools.lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def parse_author_name(name):
+    """
+    Parses one BibTeX name into (first, von, last, jr) Unicode strings. Handles
+    the three BibTeX forms: "First von Last", "von Last, First" and
+    "von Last, Jr, First"; braced groups are kept together.
+    """
+    commas = _split_top_level(name, ',')
+    if len(commas) == 1:
+        words = _split_top_level(name, None)
+        # First = leading words up to the first lowercase one (never the last word)
+        von_start = next((i for i, word in enumerate(words[:-1]) if _is_lowercase_word(word)),
+                         max(len(words) - 1, 0))
+        first = words[:von_start]
+        von, last = _split_von_last(words[von_start:])
+        jr = []
+    else:
+        von, last = _split_von_last(_split_top_level(commas[0], None))
+        jr = _split_top_level(commas[1], None) if len(commas) > 2 else []
+        first = _split_top_level(",".join(commas[2:] if len(commas) > 2 else commas[1:]), None)
+    return tuple(latex_to_unicode(" ".join(part)) for part in (first, von, last, jr))
+
+def format_author_name(name):
+    """Display form of a parsed name: "First von Last Jr"."""
+    return " ".join(part for part in name if part)
+
+@functools.lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def parse_authors(field):
+    """
+    Returns the parsed names of an author field, in order. "and others"
+    is returned as None (rendered as "et al.").
+    """
+    names = []
+    current = []
+    for word in _split_top_level(field, None):
+        if word.lower() == 'and':
+            names.append(" ".join(current))
+            current = []
+        else:
+            current.append(word)
+    names.append(" ".join(current))
+    return tuple(None if name.lower() == 'others' else parse_author_name(name)
+                 for name in names if name)
+
+@functools.lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def _format_author_field(field):
+    return ", ".join("et al." if name is None else format_author_name(name)
+                     for name in parse_authors(field))
 
-def generate_buttons_html(entry):
+def format_authors(entry):
+    """Formats the author field of an entry as "First Last, First Last, ..."."""
+    return _format_author_field(entry.get('author', 'Unknown'))
+
+def load_author_index(bib_file):
+    """Returns the author index of a bib file, see load_bib_indexes()."""
+    return load_bib_indexes(bib_file).get('author', {})
+
+def generate_buttons_html(entry, pdf_url=None):
     """
     Generates the HTML for the PDF, DOI, ArXiv, and Code buttons.
+    `pdf_url` is the URL of the local PDF (see find_publication_pdf).
     """
-    citation_key = entry.get('ID')
     buttons = []
     
     # --- A. PDF Button ---
-    pdf_link = entry.get('pdf') or entry.get('file')
-    if not pdf_link:
-        local_path = f"docs/pdfs/publications/{citation_key}.pdf"
-        if os.path.exists(local_path):
-            pdf_link = f"/pdfs/publications/{citation_key}.pdf"
+    pdf_link = entry.get('pdf') or entry.get('file') or pdf_url
     
     if pdf_link:
         buttons.append(f'<a href="{pdf_link}" class="table-icon" target="_blank" title="PDF"><i class="fa-solid fa-file-pdf"></i> </a>')
@@ -95,23 +1393,614 @@ def generate_buttons_html(entry):
             
     return "\n".join(buttons)
 
-def create_publication_pages():
+# --- PUBLICATION RECORDS ---
+_MONTHS = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
+    'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+# Publication of each citation key, see publication()
+_PUBLICATIONS = _shared("publications")
+
+def _publication_description(entry, abstract):
+    """Frontmatter description: description/note/annote, else the start of the abstract."""
+    # 1. Look for explicit description/note fields
+    raw_desc = entry.get('description') or entry.get('note') or entry.get('annote')
+
+    # 2. Fallback to truncated abstract
+    if not raw_desc:
+        clean_abs = clean_text(abstract)
+        if clean_abs and clean_abs != 'No abstract available.':
+            limit = 160
+            raw_desc = clean_abs[:limit] + "..." if len(clean_abs) > limit else clean_abs
+        else:
+            raw_desc = ""
+
+    # 3. Clean and escape for YAML
+    return clean_text(raw_desc).replace('"', '\\"')
+
+def _publication_date(entry, year):
+    """ISO date of an entry: its 'date' field, else year and month (day 1)."""
+    # Prioritize explicit 'date' field in bibtex (e.g. 2023-05-12)
+    pub_date = entry.get('date')
+    if pub_date:
+        return pub_date
+    # Absolute fallback if no year is found
+    if year == 'N/A':
+        return "1970-01-01"
+
+    # Attempt to extract month (number or name), default to January
+    raw_month = entry.get('month', '01').lower()
+    month = '01'
+    if raw_month.isdigit():
+        month = raw_month.zfill(2)
+    else:
+        for name, number in _MONTHS.items():
+            if name in raw_month:
+                month = number
+                break
+    return f"{year}-{month}-01"
+
+class Publication:
     """
-    Generates a Markdown file for each publication in the BibTeX file.
-    Includes 'description' and 'date' in frontmatter.
+    The fields of a bib entry that the pages, the table and the feed display,
+    each derived once. The raw entry is not kept, only its digest (see
+    _fields_digest); get instances through publication().
     """
-    entries = load_bib_data(BIB_FILE)
-    if not entries:
+    __slots__ = ('digest', 'key', 'title', 'authors', 'year', 'venue', 'abstract',
+                 'description', 'date', 'pdf_url', 'links')
+
+    def __init__(self, entry, pdf_url, digest=None):
+        self.digest = digest or _fields_digest(entry)
+        self.key = entry.get('ID')
+        self.title = clean_text(entry.get('title', 'Untitled'))
+        self.authors = format_authors(entry)
+        self.year = entry.get('year', 'N/A')
+        self.venue = entry.get('journal') or entry.get('booktitle') or "Preprint"
+        self.abstract = entry.get('abstract', 'No abstract available.')
+        self.description = _publication_description(entry, self.abstract)
+        self.date = _publication_date(entry, self.year)
+        self.pdf_url = pdf_url
+        self.links = generate_buttons_html(entry, pdf_url)
+
+    @property
+    def page_link(self):
+        return f"/publications/{self.key}/"
+
+    def row(self):
+        """The data of its row in the publication table (and the JSON feed)."""
+        return {
+            'year': self.year,
+            'title': self.title,
+            'authors': self.authors,
+            'venue': self.venue,
+            'links': self.links,
+            'page_link': self.page_link,
+        }
+
+def publication(entry, pdf_url):
+    """
+    Returns the Publication of a bib entry, whose local PDF has the URL
+    `pdf_url` (see find_publication_pdf). Records are kept across builds
+    and `mkdocs serve` reloads while the entry and its local PDF are
+    unchanged, so the page generator and the table share one normalization.
+    """
+    citation_key = entry.get('ID')
+    digest = _fields_digest(entry)
+    cached = _PUBLICATIONS.get(citation_key)
+    if cached is not None and cached.pdf_url == pdf_url and cached.digest == digest:
+        return cached
+    record = _PUBLICATIONS[citation_key] = Publication(entry, pdf_url, digest)
+    return record
+
+def prune_publications(citation_keys):
+    """Forgets the records of the keys missing from `citation_keys` (the whole bibliography)."""
+    for key in [key for key in _PUBLICATIONS if key not in citation_keys]:
+        del _PUBLICATIONS[key]
+
+@incremental
+def load_publications(bib_file):
+    """
+    Returns the Publications of a bib file, newest first (the order of
+    load_bib_data). The entries are streamed (see iter_bib_entries) and
+    dropped once their Publication is built, so the raw bibliography is
+    never held as a whole; rebuilt when the bib or a local PDF changes.
+    """
+    publications = []
+    for chunk in iter_bib_entries(bib_file):
+        for entry in chunk:
+            pub = publication(entry, find_publication_pdf(entry.get('ID')))
+            publications.append((_year_sort_key(entry), pub))
+    # sorted() is stable: within a year, entries keep their file order
+    publications.sort(key=lambda item: item[0], reverse=True)
+    return [pub for _, pub in publications]
+
+@incremental
+def _publications_by_key(bib_file):
+    return {pub.key: pub for pub in load_publications(bib_file)}
+
+def bib_publications(bib_file, citation_keys):
+    """Returns the Publications with the given citation keys, in that order."""
+    by_key = _publications_by_key(bib_file)
+    return [by_key[key] for key in citation_keys if key in by_key]
+
+def _metadata_date(post):
+    """Returns the frontmatter date (or date.created) of a page, or datetime.date.min."""
+    raw_date = post.get('date')
+    if isinstance(raw_date, dict):
+        raw_date = raw_date.get('created')
+    if isinstance(raw_date, (datetime.date, datetime.datetime)):
+        return raw_date
+    if isinstance(raw_date, str):
+        try:
+            return datetime.datetime.strptime(raw_date, "%Y-%m-%d").date()
+        except ValueError:
+            pass
+    return datetime.date.min
+
+def _page_url(filepath, post, routes):
+    """
+    Returns the site URL of a Markdown page: its URL in `routes` (the table
+    of blog_routes) for blog posts, /<path>/ otherwise.
+    """
+    url = routes.get(os.path.abspath(filepath))
+    if url:
+        return url
+    try:
+        rel_path = os.path.relpath(filepath, "docs")
+    except ValueError:
+        # Another drive on Windows
+        rel_path = filepath
+    return "/" + rel_path.replace(os.sep, "/").replace(".md", "/")
+
+# --- BLOG ROUTES ---
+# Settings of the material/blog plugin, as in mkdocs.yml (define_env reads
+# the actual values from the plugin's configuration)
+BLOG_DIR = "blog"
+BLOG_POST_DIR = "{blog}/posts"
+BLOG_POST_URL_FORMAT = "{date}/{slug}"
+BLOG_POST_URL_DATE_FORMAT = "yyyy/MM/dd"
+BLOG_POST_URL_MAX_CATEGORIES = 1
+# Slug functions of posts and categories, called as f(text, separator)
+BLOG_POST_SLUGIFY = slugify(case="lower")
+BLOG_POST_SLUGIFY_SEPARATOR = "-"
+BLOG_CATEGORIES_SLUGIFY = slugify(case="lower")
+BLOG_CATEGORIES_SLUGIFY_SEPARATOR = "-"
+BLOG_LOCALE = "en"
+# mkdocs.yml the settings above were read from: every output that depends on
+# the post URLs depends on it too (see blog_routes)
+BLOG_CONFIG_FILE = None
+
+# URL of every post of the current build, see blog_routes():
+# {'routes': {absolute path: URL}, 'paths': [posts read]}
+_BLOG_ROUTES = {}
+# URL of each post, reused while its frontmatter (the cached dict of
+# get_metadata) and the blog settings are the same:
+# absolute path -> (metadata, settings, URL)
+_POST_URLS = _shared("post_urls")
+
+def _blog_posts_dir():
+    return os.path.join("docs", BLOG_POST_DIR.format(blog=BLOG_DIR))
+
+def _blog_settings():
+    return (BLOG_DIR, BLOG_POST_DIR, BLOG_POST_URL_FORMAT, BLOG_POST_URL_DATE_FORMAT,
+            BLOG_POST_URL_MAX_CATEGORIES, BLOG_POST_SLUGIFY, BLOG_POST_SLUGIFY_SEPARATOR,
+            BLOG_CATEGORIES_SLUGIFY, BLOG_CATEGORIES_SLUGIFY_SEPARATOR, BLOG_LOCALE)
+
+def _post_title(filepath, post):
+    """
+    Title the blog plugin slugs a post from: the frontmatter title, else a
+    '# ' heading on the first line of the body, else the file name.
+    """
+    if 'title' in post:
+        return str(post['title'])
+    _count('files_read')
+    with open(filepath, encoding='utf-8-sig') as f:
+        lines = iter(f)
+        if _FM_BOUNDARY_RE.match(next(lines, "")):
+            for line in lines:
+                if _FM_BOUNDARY_RE.match(line):
+                    break
+        for line in lines:
+            line = line.strip()
+            if line:
+                if line.startswith('# '):
+                    return line.lstrip('# ')
+                break
+    title = os.path.splitext(os.path.basename(filepath))[0].replace('-', ' ').replace('_', ' ')
+    return title.capitalize() if title.lower() == title else title
+
+def _post_url(filepath, post):
+    """URL the blog plugin gives a post, None without a date (not a valid post)."""
+    created = post.get('date')
+    if isinstance(created, dict):
+        created = created.get('created')
+    if not isinstance(created, datetime.datetime):
+        if not isinstance(created, datetime.date):
+            return None
+        created = datetime.datetime.combine(created, datetime.time())
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=datetime.timezone.utc)
+
+    slug = post.get('slug') or BLOG_POST_SLUGIFY(_post_title(filepath, post), BLOG_POST_SLUGIFY_SEPARATOR)
+    categories = post.get('categories') or []
+    path = BLOG_POST_URL_FORMAT.format(
+        categories="/".join(BLOG_CATEGORIES_SLUGIFY(str(name), BLOG_CATEGORIES_SLUGIFY_SEPARATOR)
+                            for name in categories[:BLOG_POST_URL_MAX_CATEGORIES]),
+        date=format_datetime(created, BLOG_POST_URL_DATE_FORMAT, locale=BLOG_LOCALE),
+        file=os.path.splitext(os.path.basename(filepath))[0],
+        slug=slug,
+    )
+    return "/" + posixpath.join(BLOG_DIR, posixpath.normpath(path.strip("/"))) + "/"
+
+def blog_routes():
+    """
+    Returns {absolute path: URL} of every post under BLOG_POST_DIR, with the
+    URL the blog plugin publishes it at. The table is built once per build
+    (see _prepare_build) and shared by every macro; the URL of an unchanged
+    post is carried over from the previous build. Callers depend on the posts
+    and on BLOG_CONFIG_FILE, so cached outputs follow edits of the settings.
+    """
+    posts_dir = _blog_posts_dir()
+    if BLOG_CONFIG_FILE:
+        _track(BLOG_CONFIG_FILE)
+    if _BLOG_ROUTES:
+        # Replay the inputs for the macro cache of the current caller
+        list_markdown_files(posts_dir, recursive=True)
+        for path in _BLOG_ROUTES['paths']:
+            _track(path)
+        return _BLOG_ROUTES['routes']
+
+    settings = _blog_settings()
+    routes = {}
+    paths = []
+    if os.path.isdir(posts_dir):
+        for filepath in list_markdown_files(posts_dir, recursive=True):
+            paths.append(filepath)
+            post = get_metadata(filepath)
+            path = os.path.abspath(filepath)
+            cached = _POST_URLS.get(path)
+            if cached is None or cached[0] is not post or cached[1] != settings:
+                cached = _POST_URLS[path] = (post, settings, _post_url(filepath, post))
+            if cached[2]:
+                routes[path] = cached[2]
+    _BLOG_ROUTES.update(routes=routes, paths=paths)
+    return routes
+
+def blog_routes_for(folder):
+    """
+    blog_routes() if `folder` may hold blog posts, else {} without reading
+    the posts (so a talks grid does not depend on them).
+    """
+    posts_dir = os.path.abspath(_blog_posts_dir())
+    folder = os.path.abspath(folder)
+    if os.path.commonpath([posts_dir, folder]) in (posts_dir, folder):
+        return blog_routes()
+    return {}
+
+def configure_blog(config):
+    """Takes the blog settings from the material/blog plugin of an MkDocs config."""
+    global BLOG_DIR, BLOG_POST_DIR, BLOG_POST_URL_FORMAT, BLOG_POST_URL_DATE_FORMAT
+    global BLOG_POST_URL_MAX_CATEGORIES, BLOG_POST_SLUGIFY, BLOG_POST_SLUGIFY_SEPARATOR
+    global BLOG_CATEGORIES_SLUGIFY, BLOG_CATEGORIES_SLUGIFY_SEPARATOR, BLOG_LOCALE, BLOG_CONFIG_FILE
+    BLOG_CONFIG_FILE = config.get('config_file_path')
+    plugin = (config.get('plugins') or {}).get('material/blog')
+    if plugin is None:
         return
+    blog = plugin.config
+    BLOG_DIR = blog.blog_dir
+    BLOG_POST_DIR = blog.post_dir
+    BLOG_POST_URL_FORMAT = blog.post_url_format
+    BLOG_POST_URL_DATE_FORMAT = blog.post_url_date_format
+    BLOG_POST_URL_MAX_CATEGORIES = blog.post_url_max_categories
+    BLOG_POST_SLUGIFY = blog.post_slugify
+    BLOG_POST_SLUGIFY_SEPARATOR = blog.post_slugify_separator
+    BLOG_CATEGORIES_SLUGIFY = blog.categories_slugify
+    BLOG_CATEGORIES_SLUGIFY_SEPARATOR = blog.categories_slugify_separator
+    theme = config.get('theme')
+    if theme and theme.get('language'):
+        BLOG_LOCALE = theme['language'].replace("-", "_")
+
+# --- BIBTEX SNIPPETS ---
+# BibTeX block of each citation key: {citation key: (fields, snippet)}, where
+# fields is the sha1 of the sorted items of the entry it was serialized from
+_BIBTEX_SNIPPETS = _shared("bibtex_snippets")
+# Citation keys serialized since the blocks were last written to CACHE_DIR
+_BIBTEX_UNSAVED = _shared("bibtex_unsaved", set)
+
+def _bibtex_cache_file():
+    if not CACHE_DIR:
+        return None
+    version = f"v{BIB_CACHE_VERSION}-{bibtexparser.__version__}"
+    return os.path.join(CACHE_DIR, f"bibtex-{version}.pickle")
+
+def _serialize_bibtex(entries):
+    """
+    Serializes entries to one BibTeX block each, in a single writer pass;
+    the output of every block is the same as bibtexparser.dumps() on its own.
+    """
+    if not entries:
+        return []
+    db = bibtexparser.bibdatabase.BibDatabase()
+    db.entries = list(entries)
+    writer = bibtexparser.bwriter.BibTexWriter()
+    writer.order_entries_by = None
+    writer.entry_separator = "\0"
+    snippets = writer.write(db).split("\0")
+    if len(snippets) != len(entries):
+        # A NUL inside a field splits a block in two
+        snippets = []
+        for entry in entries:
+            db.entries = [entry]
+            snippets.append(bibtexparser.dumps(db))
+    return snippets
 
-    # Ensure output directory exists
-    os.makedirs(PUB_OUTPUT_DIR, exist_ok=True)
+def bibtex_snippets(entries):
+    """
+    Returns the BibTeX block of each entry, in order. Blocks are kept (in
+    memory and in CACHE_DIR) per citation key together with a digest of the
+    fields they were serialized from, so only new or edited entries are
+    serialized - all of them in one writer pass. save_bibtex_snippets()
+    persists them.
+    """
+    entries = list(entries)
+    cache_file = _bibtex_cache_file()
+    if not _BIBTEX_SNIPPETS and cache_file and os.path.exists(cache_file):
+        _count('files_read')
+        try:
+            with open(cache_file, 'rb') as f:
+                _BIBTEX_SNIPPETS.update(pickle.load(f))
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            log.warning("Ignoring unreadable %s: %s", cache_file, e)
+
+    fields = [_fields_digest(entry) for entry in entries]
+    stale = [i for i, entry in enumerate(entries)
+             if (_BIBTEX_SNIPPETS.get(entry.get('ID')) or (None,))[0] != fields[i]]
+    _count('cache_hits', len(entries) - len(stale))
+    for i, snippet in zip(stale, _serialize_bibtex([entries[i] for i in stale])):
+        _BIBTEX_SNIPPETS[entries[i].get('ID')] = (fields[i], snippet)
+        _BIBTEX_UNSAVED.add(entries[i].get('ID'))
+    return [_BIBTEX_SNIPPETS[entry.get('ID')][1] for entry in entries]
+
+def save_bibtex_snippets(citation_keys):
+    """
+    Drops the blocks of keys missing from `citation_keys` (the keys of the
+    whole bibliography) and writes the blocks to CACHE_DIR if any changed
+    since the last save.
+    """
+    removed = [key for key in _BIBTEX_SNIPPETS if key not in citation_keys]
+    for key in removed:
+        del _BIBTEX_SNIPPETS[key]
+    cache_file = _bibtex_cache_file()
+    if (_BIBTEX_UNSAVED or removed) and cache_file:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(_BIBTEX_SNIPPETS, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _count('bytes_written', f.tell())
+        os.replace(tmp_file, cache_file)
+    _BIBTEX_UNSAVED.clear()
+
+# --- OUTPUT WRITER ---
+def _content_hash(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def _staging_dir(folder):
+    """
+    Where the temporary files of a batch for `folder` are written: outside
+    the watched docs tree (CACHE_DIR/staging) when that is on the same file
+    system, so that only the final renames are seen; `folder` otherwise.
+    """
+    if CACHE_DIR:
+        staging = os.path.join(CACHE_DIR, "staging")
+        os.makedirs(staging, exist_ok=True)
+        if os.stat(staging).st_dev == os.stat(folder).st_dev:
+            return staging
+    return folder
+
+# Files handed to each pool task of an OutputBatch
+OUTPUT_BATCH_CHUNK = 256
 
+class OutputBatch:
+    """
+    Writes a batch of generated files into `folder` (e.g. PUB_OUTPUT_DIR):
+
+        with OutputBatch(folder, known) as batch:
+            batch.write("key.md", content)
+            batch.stage()  # optional: write what is queued to temporary files now
+            batch.remove("old.md")
+        batch.hashes  # {relative path: sha256 of the content}
+        batch.fingerprints  # {relative path: (mtime_ns, size)} of the files written or read
+
+    `known` maps the files already in the folder to the sha256 of their
+    content, or None when it is not known (that file is read once to compare).
+    See _verified_outputs() for checking stored hashes against the disk.
+    Staging (in stage() and when the block exits) hashes the queued contents
+    in a thread pool and writes the changed ones to temporary files, after
+    which the contents are no longer held. When the block exits, all staged
+    files are renamed into place at once (and removals done), so the docs
+    watcher of `mkdocs serve` sees one burst of complete files and rebuilds
+    once. Files whose content did not change are never touched. If the block
+    raises, nothing in `folder` changes.
+    """
+    __slots__ = ('folder', 'known', 'hashes', 'fingerprints', 'workers',
+                 '_files', '_staged', '_removed', '_staging')
+
+    def __init__(self, folder, known=None, workers=None):
+        self.folder = folder
+        self.known = known or {}
+        self.hashes = {}
+        self.fingerprints = {}
+        self.workers = workers or OUTPUT_WRITE_WORKERS
+        self._files = []
+        self._staged = []
+        self._removed = []
+        self._staging = None
+
+    def __enter__(self):
+        return self
+
+    def write(self, rel_path, content):
+        """Queues `content` for `folder`/`rel_path`."""
+        self._files.append((rel_path, content))
+
+    def remove(self, rel_path):
+        """Deletes `folder`/`rel_path` when the batch is committed."""
+        self._removed.append(rel_path)
+
+    def _stage(self, rel_path, content):
+        """
+        Returns (sha256, temporary file or None if unchanged, files read,
+        bytes written, fingerprint of the file if it was read and unchanged).
+        """
+        digest = _content_hash(content)
+        known = self.known.get(rel_path, False)
+        if known == digest:
+            return digest, None, 0, 0, None
+        target = os.path.join(self.folder, rel_path)
+        if known is None:
+            try:
+                with open(target, encoding='utf-8') as f:
+                    if f.read() == content:
+                        return digest, None, 1, 0, _path_fingerprint(target)
+            except (OSError, UnicodeDecodeError):
+                pass
+        staging = self._staging if self._staging != self.folder else os.path.dirname(target)
+        os.makedirs(staging, exist_ok=True)
+        # One temporary file per target, named after its absolute path
+        name = hashlib.sha1(os.path.abspath(target).encode('utf-8')).hexdigest()[:16]
+        tmp_file = os.path.join(staging, f".{os.getpid()}-{name}.tmp")
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+                written = f.tell()
+        except BaseException:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+        return digest, tmp_file, int(known is None), written, None
+
+    def _stage_chunk(self, files):
+        """
+        Stages `files` in order; returns ([(relative path, staged result)],
+        first error or None). Stops at the first error, with the files staged
+        so far returned so that their temporary files can be removed.
+        """
+        staged = []
+        for rel_path, content in files:
+            try:
+                staged.append((rel_path, self._stage(rel_path, content)))
+            except Exception as e:
+                return staged, e
+        return staged, None
+
+    def stage(self):
+        """
+        Writes the files queued so far to temporary files, so that their
+        contents are not held until the batch is committed.
+        """
+        if not self._files:
+            return
+        if self._staging is None:
+            os.makedirs(self.folder, exist_ok=True)
+            self._staging = _staging_dir(self.folder)
+        chunks = [self._files[i:i + OUTPUT_BATCH_CHUNK]
+                  for i in range(0, len(self._files), OUTPUT_BATCH_CHUNK)]
+        self._files = []
+        error = None
+        if self.workers > 1 and len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(chunks))) as pool:
+                # Every chunk is collected, even after a failure, to clean up
+                for chunk_staged, chunk_error in pool.map(self._stage_chunk, chunks):
+                    self._staged.extend(chunk_staged)
+                    error = error or chunk_error
+        else:
+            for chunk in chunks:
+                chunk_staged, error = self._stage_chunk(chunk)
+                self._staged.extend(chunk_staged)
+                if error is not None:
+                    break
+        if error is not None:
+            self._discard()
+            raise error
+
+    def _discard(self):
+        """Removes the temporary files staged so far."""
+        for _, (_, tmp_file, _, _, _) in self._staged:
+            if tmp_file and os.path.exists(tmp_file):
+                os.remove(tmp_file)
+        self._staged = []
+        self._files = []
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._discard()
+            return False
+        self.stage()
+        os.makedirs(self.folder, exist_ok=True)
+
+        changed = 0
+        for rel_path, (digest, tmp_file, files_read, written, fingerprint) in self._staged:
+            self.hashes[rel_path] = digest
+            _count('files_read', files_read)
+            if tmp_file is None:
+                _count('cache_hits')
+                if fingerprint is not None:
+                    self.fingerprints[rel_path] = fingerprint
+                continue
+            target = os.path.join(self.folder, rel_path)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(tmp_file, target)
+            self.fingerprints[rel_path] = _path_fingerprint(target)
+            _count('bytes_written', written)
+            changed += 1
+        self._staged = []
+        for rel_path in self._removed:
+            os.remove(os.path.join(self.folder, rel_path))
+        if changed or self._removed:
+            log.debug("%s: %d file(s) written, %d removed", self.folder, changed, len(self._removed))
+            refresh_asset_indexes(self.folder)
+        return False
+
+def _verified_outputs(folder, hashes, fingerprints, existing):
+    """
+    Returns {relative path: (sha256, fingerprint)} of the files of `folder`
+    that still hold what a previous build wrote, given the `hashes` and
+    `fingerprints` ((mtime_ns, size)) it recorded and the relative paths that
+    `existing` now. A file whose fingerprint is the recorded one is trusted;
+    any other (edited by hand, or restored from a cache onto another
+    checkout) is read once and kept only if its content hash still matches.
+    """
+    verified = {}
+    for rel_path, digest in hashes.items():
+        if rel_path not in existing:
+            continue
+        path = os.path.join(folder, rel_path)
+        fingerprint = _path_fingerprint(path)
+        if fingerprint is None:
+            continue
+        recorded = fingerprints.get(rel_path)
+        if recorded is None or tuple(recorded) != fingerprint:
+            _count('files_read')
+            try:
+                with open(path, encoding='utf-8') as f:
+                    if _content_hash(f.read()) != digest:
+                        continue
+            except (OSError, UnicodeDecodeError):
+                continue
+        verified[rel_path] = (digest, fingerprint)
+    return verified
+
+# --- TEMPLATES ---
+PUB_PAGE_TEMPLATE = "publication_page.md"
+PUB_TABLE_TEMPLATE = "publication_table.html"
+PUB_INDEX_TEMPLATE = "publication_index.md"
+
+DEFAULT_TEMPLATES = {
     # Template with description and date fields in frontmatter
-    md_template = """---
-title: "{title}"
-description: "{description}"
-date: "{date}"
+    PUB_PAGE_TEMPLATE: """---
+title: "{{ title }}"
+description: "{{ description }}"
+date: "{{ date }}"
 hide:
   - nav
 ---
@@ -119,213 +2008,957 @@ hide:
 <div class="pub-page-layout">
     
     <div class="pub-header">
-        <h1>{title}</h1>
+        <h1>{{ title }}</h1>
         <div class="pub-meta">
-            <span class="pub-venue">{venue}</span>
-            <span class="pub-year">{year}</span>
+            <span class="pub-venue">{{ venue }}</span>
+            <span class="pub-year">{{ year }}</span>
         </div>
-        <div class="pub-authors-list">{authors}</div>
+        <div class="pub-authors-list">{{ authors }}</div>
         <div class="pub-actions">
-            {buttons}
+            {{ buttons }}
         </div>
     </div>
 
 </div>
-{image_div}
+{{ image_div }}
 
 ## Abstract
-{abstract}
+{{ abstract }}
 
 ## BibTex
 ```
-{bibtex_str}
+{{ bibtex_str }}
 ```
-"""
+""",
+
+    PUB_TABLE_TEMPLATE: """
+<div class="table-container">
+{% if feed_url %}
+<div class="pub-table-toolbar">
+    <input type="search" class="pub-table-filter" placeholder="Filter by title, author, venue or year" aria-label="Filter publications">
+    <select class="pub-table-sort" aria-label="Sort publications">
+        <option value="newest">Newest first</option>
+        <option value="oldest">Oldest first</option>
+        <option value="title">Title (A-Z)</option>
+    </select>
+</div>
+<table class="neon-table" data-feed="{{ feed_url }}" data-page-size="{{ page_size }}" data-total="{{ total }}">
+{% else %}
+<table class="neon-table">
+{% endif %}
+    <thead>
+        <tr>
+            <th width="10%">Year</th>
+            <th width="60%">Title & Authors</th>
+            <th width="15%">Venue</th>
+            <th width="15%">Links</th>
+        </tr>
+    </thead>
+    <tbody>
+{% for row in rows %}
+    <tr>
+        <td class="year-cell">{{ row.year }}</td>
+        <td>
+            <div class="pub-title">
+                <a href="{{ row.page_link }}" class="title-link">{{ row.title }}</a>
+            </div>
+            <div class="pub-authors">{{ row.authors }}</div>
+        </td>
+        <td class="venue-cell">{{ row.venue }}</td>
+        <td style="text-align: center;">
+            {{ row.links }}
+        </td>
+    </tr>
+{% endfor %}
+</tbody></table>
+{% if feed_url %}
+<button type="button" class="neon-button pub-table-more"{% if total <= page_size %} hidden{% endif %}>Load more</button>
+{% endif %}
+</div>
+""",
+
+    # Pages of PUB_INDEX_OUTPUT_DIR; the macros render the (cached) content
+    PUB_INDEX_TEMPLATE: """---
+title: {{ title|tojson }}
+description: {{ description|tojson }}
+hide:
+  - navigation
+  - toc
+---
+
+<div class="hero-section" style="padding-bottom: 1rem;">
+  <h1 class="hero-title">{{ title }}</h1>
+  <p class="hero-subtitle">{{ description }}</p>
+</div>
 
+{% if key %}
+{{ "{{" }} publications_by({{ kind|tojson }}, {{ key|tojson }}) | safe {{ "}}" }}
+{% else %}
+{{ "{{" }} publication_index_links({{ kind|tojson }}) | safe {{ "}}" }}
+{% endif %}
+""",
+}
+
+# Compiled templates are cached by the environment, so each one is parsed once
+_templates = Environment(
+    loader=ChoiceLoader([FileSystemLoader(TEMPLATE_DIR), DictLoader(DEFAULT_TEMPLATES)]),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    keep_trailing_newline=True,
+)
+
+def get_template(name):
+    """Returns the compiled template `name`, preferring TEMPLATE_DIR overrides."""
+    # Tracked even while missing: adding an override must invalidate outputs.
+    # Built-in templates have no file; they change with this module.
+    _track(os.path.join(TEMPLATE_DIR, name))
+    return _templates.get_template(name)
+
+def _template_digest(name):
+    """Hashes the source of a template so that edits invalidate its outputs."""
+    _track(os.path.join(TEMPLATE_DIR, name))
+    source = _templates.loader.get_source(_templates, name)[0]
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+def _publication_fingerprint(entry, image, pdf_url, template_digest):
+    """
+    Hashes everything a publication page is rendered from: the entry fields,
+    the local PDF (by hash, in `pdf_url`), the image variants and the
+    template (source and version).
+    """
+    payload = json.dumps([PUB_TEMPLATE_VERSION, template_digest, entry, pdf_url, image],
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def _picture_html(image, alt):
+    """Builds a <picture> with one srcset per variant format and the original as fallback."""
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{", ".join(f"{url} {w}w" for w, url in variants)}" '
+        f'sizes="{PUB_IMAGE_SIZES}">'
+        for fmt, variants in image['sources'].items()
+    )
+    return (f'<picture>{sources}<img src="{image["src"]}" alt="{alt}" class="pub-page-image" '
+            f'width="{image["width"]}" height="{image["height"]}" loading="lazy" decoding="async" />'
+            f'</picture>')
+
+def _render_publication_page(pub, image, bibtex_str):
+    """Builds the Markdown of a single publication page (`bibtex_str`: its BibTeX block)."""
+    # Handle Image
+    image_html = ""
+    found_image = image is not None
+    if found_image:
+        image_html = _picture_html(image, pub.key)
+    
+    # Format the content
+    return get_template(PUB_PAGE_TEMPLATE).render(
+        title=pub.title,
+        description=pub.description,
+        date=pub.date,
+        venue=pub.venue,
+        year=pub.year,
+        authors=pub.authors,
+        buttons=pub.links,
+        image_class='has-image' if found_image else 'no-image',
+        image_div=f'<div class="pub-image-container">{image_html}</div>' if found_image else '',
+        abstract=pub.abstract,
+        bibtex_str=bibtex_str
+    )
+
+def _publication_rows(entries):
+    """Yields the Publication of each row of the publication table (see Publication.row)."""
     for entry in entries:
-        citation_key = entry.get('ID')
-        if not citation_key: continue
-
-        filename = os.path.join(PUB_OUTPUT_DIR, f"{citation_key}.md")
-        
-        # Prepare Data
-        title = clean_text(entry.get('title', 'Untitled'))
-        authors = format_authors(entry)
-        year = entry.get('year', 'N/A')
-        venue = entry.get('journal') or entry.get('booktitle') or "Preprint"
-        abstract = entry.get('abstract', 'No abstract available.')
-        
-        # --- GENERATE DESCRIPTION (Hybrid Method) ---
-        # 1. Look for explicit description/note fields
-        raw_desc = entry.get('description') or entry.get('note') or entry.get('annote')
-        
-        # 2. Fallback to truncated abstract
-        if not raw_desc:
-            clean_abs = clean_text(abstract)
-            if clean_abs and clean_abs != 'No abstract available.':
-                limit = 160
-                raw_desc = clean_abs[:limit] + "..." if len(clean_abs) > limit else clean_abs
-            else:
-                raw_desc = ""
-        
-        # 3. Clean and escape for YAML
-        description = clean_text(raw_desc).replace('"', '\\"')
-
-        # --- GENERATE DATE ---
-        # Prioritize explicit 'date' field in bibtex (e.g. 2023-05-12)
-        pub_date = entry.get('date')
-        
-        # Fallback: Construct date from year and month
-        if not pub_date:
-            if year != 'N/A':
-                # Attempt to extract month, default to January
-                raw_month = entry.get('month', '01').lower()
-                
-                # Simple parsing for text months (jan, feb...)
-                month_map = {
-                    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04', 'may': '05', 'jun': '06',
-                    'jul': '07', 'aug': '08', 'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                }
-                
-                month = '01'
-                if raw_month.isdigit():
-                    month = raw_month.zfill(2)
-                else:
-                    for k, v in month_map.items():
-                        if k in raw_month:
-                            month = v
-                            break
-                
-                pub_date = f"{year}-{month}-01"
-            else:
-                # Absolute fallback if no year is found
-                pub_date = "1970-01-01"
-
-        # Generate Buttons
-        buttons = generate_buttons_html(entry)
-
-        # Handle Image
-        image_html = ""
-        found_image = False
-        for ext in ['.png', '.jpg', '.jpeg', '.gif', '.webp']:
-            possible_path = os.path.join(PUB_IMAGE_DIR_ABS, f"{citation_key}{ext}")
-            if os.path.exists(possible_path):
-                image_src = f"/{PUB_IMAGE_DIR_REL}/{citation_key}{ext}"
-                image_html = f'<img src="{image_src}" alt="{citation_key}" class="pub-page-image" />'
-                found_image = True
-                break
-        
-        # Prepare BibTeX string safely
-        db = bibtexparser.bibdatabase.BibDatabase()
-        db.entries = [entry]
-        bibtex_str = bibtexparser.dumps(db)
-        
-        # Format the content
-        md_content = md_template.format(
-            title=title,
-            description=description,
-            date=pub_date,
-            venue=venue,
-            year=year,
-            authors=authors,
-            buttons=buttons,
-            image_class='has-image' if found_image else 'no-image',
-            image_div=f'<div class="pub-image-container">{image_html}</div>' if found_image else '',
-            abstract=abstract,
-            bibtex_str=bibtex_str
-        )
-        
-        # Write file only if content changed to avoid unnecessary rebuild loops
-        write_file = True
-        if os.path.exists(filename):
-            with open(filename, 'r', encoding='utf-8') as f:
-                if f.read().strip() == md_content.strip():
-                    write_file = False
-        
-        if write_file:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(md_content)
+        yield publication(entry, find_publication_pdf(entry.get('ID')))
+
+def _first_page_entries(bib_file, page_size):
+    """
+    Returns the `page_size` newest entries using the (year, key) index, so the
+    rest of the bibliography never has to be held in memory.
+    """
+    wanted = {key: rank for rank, (_, key) in enumerate(load_bib_index(bib_file)[:page_size])}
+    found = [None] * len(wanted)
+    for chunk in iter_bib_entries(bib_file):
+        for entry in chunk:
+            rank = wanted.pop(entry.get('ID'), None)
+            if rank is not None:
+                found[rank] = entry
+        if not wanted:
+            break
+    return [entry for entry in found if entry is not None]
+
+@incremental
+def _publication_feed(bib_file):
+    """The JSON text of the feed, or None without publications."""
+    publications = load_publications(bib_file)
+    if not publications:
+        return None
+    return json.dumps([pub.row() for pub in publications], ensure_ascii=False,
+                      separators=(',', ':'))
+
+def write_publication_feed(site_dir, bib_file=BIB_FILE):
+    """
+    Writes the compact JSON index of all publications (the table rows, newest
+    first) to PUB_FEED_PATH inside the built site.
+    """
+    feed = _publication_feed(bib_file)
+    if feed is None:
+        return
+    feed_file = os.path.join(site_dir, PUB_FEED_PATH)
+    os.makedirs(os.path.dirname(feed_file), exist_ok=True)
+    with open(feed_file, 'w', encoding='utf-8') as f:
+        f.write(feed)
+        _count('bytes_written', f.tell())
+
+def _manifest_path():
+    return os.path.join(CACHE_DIR, "publications-manifest.json") if CACHE_DIR else None
+
+def _output_root():
+    """The folder holding PUB_OUTPUT_DIR and PUB_INDEX_OUTPUT_DIR, which are written as one batch."""
+    return os.path.commonpath([os.path.abspath(PUB_OUTPUT_DIR), os.path.abspath(PUB_INDEX_OUTPUT_DIR)])
+
+def _load_manifest():
+    """
+    Returns ({citation_key: fingerprint}, {relative path: content sha256},
+    {relative path: (mtime_ns, size)}) of the publication and index pages
+    generated by the last build (paths relative to _output_root()), empty if
+    there is no usable manifest.
+    """
+    manifest_file = _manifest_path()
+    if not manifest_file or not os.path.exists(manifest_file):
+        return {}, {}, {}
+    _count('files_read')
+    try:
+        with open(manifest_file, encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}, {}, {}
+    # A manifest written for other output folders says nothing about these
+    if manifest.get('output_dirs') != [PUB_OUTPUT_DIR, PUB_INDEX_OUTPUT_DIR]:
+        return {}, {}, {}
+    return manifest.get('pages', {}), manifest.get('hashes', {}), manifest.get('files', {})
+
+def _save_manifest(pages, hashes, files):
+    manifest_file = _manifest_path()
+    if not manifest_file:
+        return
+    os.makedirs(os.path.dirname(manifest_file), exist_ok=True)
+    tmp_file = manifest_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump({'output_dirs': [PUB_OUTPUT_DIR, PUB_INDEX_OUTPUT_DIR],
+                   'pages': pages, 'hashes': hashes, 'files': files},
+                  f, indent=1, sort_keys=True)
+        _count('bytes_written', f.tell())
+    os.replace(tmp_file, manifest_file)
+
+@profiled()
+@incremental
+def create_publication_pages():
+    """
+    Generates a Markdown file for each publication in the BibTeX file.
+    Includes 'description' and 'date' in frontmatter.
+
+    Pages are incremental: a manifest in CACHE_DIR stores a fingerprint of the
+    inputs of every page, so only new or changed entries are rendered, and
+    pages of entries removed from the bib are deleted. A page is only skipped
+    while its file still holds what was written (see _verified_outputs), so
+    edited pages and pages of another checkout are rewritten.
+
+    Only one chunk of entries (BIB_CHUNK_SIZE) and its rendered pages is held
+    at a time: each chunk is staged into the OutputBatch before the next one
+    is read. The same pass counts the entries of every index value, from
+    which the index pages are written (see _write_publication_index_pages).
+    All of it is committed as one batch at the end, so `mkdocs serve` sees a
+    single burst of changes per build.
+    """
+    if not os.path.exists(BIB_FILE):
+        return
+
+    # Ensure output directory exists
+    os.makedirs(PUB_OUTPUT_DIR, exist_ok=True)
+
+    prepare_publication_images()
+    previous, previous_hashes, previous_files = _load_manifest()
+    template_digest = _template_digest(PUB_PAGE_TEMPLATE)
+    root = _output_root()
+    pages_dir = os.path.relpath(PUB_OUTPUT_DIR, root)
+    index_dir = os.path.relpath(PUB_INDEX_OUTPUT_DIR, root)
+
+    existing_pages = _asset_index(PUB_OUTPUT_DIR, ['.md'])
+    existing_indexes = set()
+    for kind in PUB_INDEX_PAGES:
+        folder = os.path.join(PUB_INDEX_OUTPUT_DIR, kind)
+        existing_indexes.update(os.path.join(index_dir, kind, name)
+                                for name in _asset_index(folder, ['.md']).values())
+    existing = existing_indexes | {os.path.join(pages_dir, f"{key}.md") for key in existing_pages}
+    verified = _verified_outputs(root, previous_hashes, previous_files, existing)
+
+    # Files still as written are compared by hash; files unknown to the
+    # manifest may already be up to date and are read once to compare; files
+    # that changed on disk are rewritten
+    known = {rel_path: verified[rel_path][0] if rel_path in verified else None
+             for rel_path in existing if rel_path in verified or rel_path not in previous_hashes}
+    current = {}
+    hashes = {}
+    files = {}
+    index_counts = {kind: {} for kind in PUB_INDEX_PAGES}
+
+    with OutputBatch(root, known) as batch:
+        # Entries are streamed in chunks (the year order is irrelevant here)
+        # and each chunk is rendered and staged before the next one is read
+        for chunk in iter_bib_entries(BIB_FILE):
+            jobs = []
+            targets = []
+            for entry in chunk:
+                _count_index_values(index_counts, entry)
+                citation_key = entry.get('ID')
+                if not citation_key: continue
+
+                image = publication_image(citation_key)
+                pdf_url = find_publication_pdf(citation_key)
+                fingerprint = _publication_fingerprint(entry, image, pdf_url, template_digest)
+                current[citation_key] = fingerprint
+                rel_path = os.path.join(pages_dir, f"{citation_key}.md")
+
+                # Inputs unchanged since the last build, page as written: nothing to render
+                if previous.get(citation_key) == fingerprint and rel_path in verified:
+                    _count('cache_hits')
+                    hashes[rel_path], files[rel_path] = verified[rel_path]
+                    continue
+
+                jobs.append((entry, image, pdf_url))
+                targets.append(rel_path)
+            if jobs:
+                _write_publication_pages(batch, jobs, targets)
+        save_bibtex_snippets(current)
+        prune_publications(current)
+
+        # Remove pages whose entry is gone from the bib. Only pages recorded in
+        # the manifest are touched, so hand-written files are never deleted.
+        for citation_key in previous.keys() - current.keys():
+            if citation_key in existing_pages:
+                batch.remove(os.path.join(pages_dir, f"{citation_key}.md"))
+        _write_publication_index_pages(batch, index_dir, index_counts, existing_indexes)
+
+    for rel_path, digest in batch.hashes.items():
+        hashes[rel_path] = digest
+        # Files compared by their known hash were not touched
+        files[rel_path] = batch.fingerprints.get(rel_path) or verified[rel_path][1]
+    files = {rel_path: list(fingerprint) for rel_path, fingerprint in files.items()}
+    if current != previous or hashes != previous_hashes or files != previous_files:
+        _save_manifest(current, hashes, files)
+
+def _write_publication_pages(batch, jobs, targets):
+    """
+    Renders the (entry, image, PDF URL) jobs of one chunk into `batch` at
+    the `targets` paths and stages them.
+    """
+    # BibTeX blocks of the pages to render, serialized together
+    snippets = bibtex_snippets(entry for entry, _, _ in jobs)
+    for rel_path, (entry, image, pdf_url), snippet in zip(targets, jobs, snippets):
+        batch.write(rel_path, _render_publication_page(publication(entry, pdf_url), image, snippet))
+    batch.stage()
+
+# --- PUBLICATION INDEXES ---
+PUB_INDEX_KINDS = {
+    # kind: (overview title, page title prefix)
+    'author': ("Authors", "Publications by"),
+    'venue': ("Venues", "Publications in"),
+    'year': ("Years", "Publications from"),
+    'keyword': ("Keywords", "Publications on"),
+}
+
+@functools.lru_cache(maxsize=AUTHOR_CACHE_SIZE)
+def _index_slug(text):
+    """URL-safe, case and accent insensitive key of an index value."""
+    text = unicodedata.normalize('NFKD', text.casefold())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return re.sub(r'[\W_]+', '-', text).strip('-') or "unknown"
+
+def _entry_index_values(entry):
+    """Yields the (kind, display value) pairs an entry is indexed under."""
+    for name in parse_authors(entry.get('author', '')):
+        if name is not None:
+            yield 'author', format_author_name(name)
+    yield 'venue', latex_to_unicode(entry.get('journal') or entry.get('booktitle') or "Preprint")
+    year = entry.get('year')
+    if year:
+        yield 'year', year.strip()
+    for keyword in re.split(r'[,;]', entry.get('keywords', '')):
+        keyword = latex_to_unicode(keyword)
+        if keyword:
+            yield 'keyword', keyword
+
+def load_bib_indexes(bib_file):
+    """
+    Returns the inverted indexes of a bib file:
+    {kind: {slug: {'name': display value, 'entries': [citation keys]}}} for
+    the kinds of PUB_INDEX_KINDS, entries newest first.
+
+    All indexes are built in a single pass over the streamed entries (O(N) in
+    the number of entries, see iter_bib_entries) and kept with the parsed bib
+    until its content changes; only the citation keys are held.
+    """
+    if not os.path.exists(bib_file):
+        return {}
+    state, _ = _bib_state(bib_file)
+    if state.get('indexes') is None:
+        # Entries are streamed in file order: the newest-first order of
+        # load_bib_data is the rank of each key in load_bib_index
+        rank = {}
+        for position, (_, citation_key) in enumerate(load_bib_index(bib_file)):
+            rank.setdefault(citation_key, position)
+        indexes = {kind: {} for kind in PUB_INDEX_KINDS}
+        # Year of the entry each display value was taken from: the newest wins
+        named = {}
+        for chunk in iter_bib_entries(bib_file):
+            for entry in chunk:
+                citation_key = entry.get('ID')
+                year = _year_sort_key(entry)
+                for kind, value in _entry_index_values(entry):
+                    slug = _index_slug(value)
+                    record = indexes[kind].setdefault(slug, {'name': value, 'entries': []})
+                    if year > named.setdefault((kind, slug), year):
+                        record['name'] = value
+                        named[(kind, slug)] = year
+                    # A name can appear twice in one entry
+                    if not record['entries'] or record['entries'][-1] != citation_key:
+                        record['entries'].append(citation_key)
+        for index in indexes.values():
+            for record in index.values():
+                record['entries'].sort(key=rank.get)
+        state['indexes'] = indexes
+    return state['indexes']
+
+def _sorted_index(kind, index):
+    """Index records in display order: years newest first, the rest by size then name."""
+    if kind == 'year':
+        return sorted(index.items(), key=lambda item: item[1]['name'], reverse=True)
+    return sorted(index.items(), key=lambda item: (-len(item[1]['entries']), item[1]['name'].casefold()))
+
+def publication_index_url(kind, slug=None):
+    """Site URL of an index page (or of the overview of `kind`), or None if not generated."""
+    if kind not in PUB_INDEX_PAGES:
+        return None
+    base = "/" + os.path.relpath(PUB_INDEX_OUTPUT_DIR, "docs").replace(os.sep, "/")
+    return f"{base}/{kind}/{slug}/" if slug else f"{base}/{kind}/"
+
+def _count_index_values(counts, entry):
+    """
+    Adds an entry to `counts`: {kind: {slug: [display value, entries, year]}}
+    for the kinds of `counts`. The display value is the one of the newest
+    entry (the first in file order among equals), as in load_bib_indexes.
+    """
+    seen = set()
+    year = _year_sort_key(entry)
+    for kind, value in _entry_index_values(entry):
+        index = counts.get(kind)
+        if index is None:
+            continue
+        slug = _index_slug(value)
+        # A name can appear twice in one entry
+        if (kind, slug) in seen:
+            continue
+        seen.add((kind, slug))
+        record = index.get(slug)
+        if record is None:
+            index[slug] = [value, 1, year]
+            continue
+        record[1] += 1
+        if year > record[2]:
+            record[0], record[2] = value, year
+
+def _index_pages(counts):
+    """Yields (relative path, Markdown) of every page of PUB_INDEX_OUTPUT_DIR."""
+    template = get_template(PUB_INDEX_TEMPLATE)
+    for kind in PUB_INDEX_PAGES:
+        overview, prefix = PUB_INDEX_KINDS[kind]
+        index = counts.get(kind, {})
+        yield os.path.join(kind, "index.md"), template.render(
+            kind=kind, key=None, title=f"Publications by {kind}",
+            description=f"{len(index)} {overview.lower()}")
+        for slug, (name, count, _) in index.items():
+            yield os.path.join(kind, f"{slug}.md"), template.render(
+                kind=kind, key=slug, title=f"{prefix} {name}",
+                description=f"{count} publication{'s' if count != 1 else ''}")
+
+def _write_publication_index_pages(batch, index_dir, counts, existing):
+    """
+    Writes the per-author/venue/year pages (see PUB_INDEX_OUTPUT_DIR, at
+    `index_dir` in `batch`) from the counts gathered by
+    create_publication_pages (see _count_index_values), so the bibliography
+    is never loaded as a whole for them, and removes the `existing` pages of
+    values that are gone. A page only holds a macro call, so it changes
+    when its title or count does.
+    """
+    written = set()
+    for rel_path, content in _index_pages(counts):
+        rel_path = os.path.join(index_dir, rel_path)
+        batch.write(rel_path, content)
+        written.add(rel_path)
+    for rel_path in existing - written:
+        batch.remove(rel_path)
+
+# --- SEARCH INDEX ---
+SEARCH_INDEX_VERSION = 1
+# Search document of each bib entry and Markdown page, reused while its source
+# (the entry or the frontmatter dict) has the digest it was made from:
+# (kind, citation key or path) -> (_fields_digest of the source, document)
+_SEARCH_DOCUMENTS = _shared("search_documents")
+
+def _search_tokens(*texts):
+    """Lowercase, accent-free words of at least 2 characters (as in site-search.js)."""
+    tokens = set()
+    for text in texts:
+        if not text:
+            continue
+        if isinstance(text, (list, tuple)):
+            tokens.update(_search_tokens(*text))
+            continue
+        text = str(text).lower()
+        if not text.isascii():
+            text = unicodedata.normalize('NFKD', text)
+            text = "".join(char for char in text if not unicodedata.combining(char))
+        tokens.update(word for word in re.findall(r'[^\W_]+', text) if len(word) >= 2)
+    return tokens
+
+@functools.lru_cache(maxsize=None)
+def _search_shard_name(prefix):
+    """File name of a token shard; non-ASCII prefixes are spelled as code points."""
+    if re.fullmatch(r'[a-z0-9]+', prefix):
+        return prefix
+    return "_" + "-".join(f"{ord(char):x}" for char in prefix)
+
+@incremental
+def _bib_search_documents(bib_file):
+    """
+    [([type, title, url, subtitle], tokens)] of the publications, newest
+    first. The entries are streamed (see iter_bib_entries): only the
+    documents are kept.
+    """
+    documents = []
+    seen = set()
+    for chunk in iter_bib_entries(bib_file):
+        for entry in chunk:
+            seen.add(entry.get('ID'))
+            digest = _fields_digest(entry)
+            cached = _SEARCH_DOCUMENTS.get(('publication', entry.get('ID')))
+            if cached is None or cached[0] != digest:
+                title = latex_to_unicode(entry.get('title', 'Untitled'))
+                authors = format_authors(entry)
+                venue = latex_to_unicode(entry.get('journal') or entry.get('booktitle') or "Preprint")
+                year = entry.get('year', '')
+                document = (['publication', title, f"/publications/{entry.get('ID')}/", f"{authors} · {venue} · {year}"],
+                            _search_tokens(title, authors, venue, year, entry.get('keywords'), entry.get('ID')))
+                cached = _SEARCH_DOCUMENTS[('publication', entry.get('ID'))] = (digest, document)
+            documents.append((_year_sort_key(entry), cached[1]))
+    _prune_search_documents('publication', seen)
+    # The order of load_bib_data: sorted() is stable, so file order within a year
+    documents.sort(key=lambda item: item[0], reverse=True)
+    return [document for _, document in documents]
+
+def _prune_search_documents(kind, seen):
+    """Forgets the documents of `kind` whose citation key or path is not in `seen`."""
+    for key in [key for key in _SEARCH_DOCUMENTS if key[0] == kind and key[1] not in seen]:
+        del _SEARCH_DOCUMENTS[key]
+
+@incremental
+def _page_search_documents(kind, folder):
+    """[([type, title, url, subtitle], tokens)] of the Markdown pages of a folder, newest first."""
+    # Tracked even while missing, so that creating it is noticed
+    _track(folder)
+    if not os.path.isdir(folder):
+        return []
+    pages = []
+    for filepath in list_markdown_files(folder, recursive=True):
+        post = get_metadata(filepath)
+        if post.get('draft') is True or not post.get('title'):
+            continue
+        pages.append((_metadata_date(post), filepath, post))
+    pages.sort(key=lambda page: (page[0], page[1]), reverse=True)
+    routes = blog_routes_for(folder)
+    documents = []
+    for _, filepath, post in pages:
+        digest = _fields_digest(post)
+        url = _page_url(filepath, post, routes)
+        cached = _SEARCH_DOCUMENTS.get((kind, filepath))
+        # The URL also depends on the blog settings, not only on the frontmatter
+        if cached is None or cached[0] != digest or cached[1][0][2] != url:
+            subtitle = post.get('description') or post.get('conference_title') or ""
+            tags = [post.get(field) for field in ('tags', 'categories', 'conference_title',
+                                                  'short_conference_title', 'location', 'type')]
+            document = ([kind, str(post['title']), url, str(subtitle)],
+                        _search_tokens(post['title'], subtitle, tags))
+            cached = _SEARCH_DOCUMENTS[(kind, filepath)] = (digest, document)
+        documents.append(cached[1])
+    _prune_search_documents(kind, {filepath for _, filepath, _ in pages})
+    return documents
+
+def _search_documents(bib_file):
+    """
+    Yields ([type, title, url, subtitle], tokens) for every searchable item:
+    publications (newest first), then talks, posts and projects (newest first).
+    Each source is its own build step, so editing a post does not re-tokenize
+    the bibliography.
+    """
+    yield from _bib_search_documents(bib_file)
+    for kind, folder in SEARCH_SOURCES.items():
+        yield from _page_search_documents(kind, folder)
+
+@incremental
+def _search_index_files(bib_file):
+    """
+    Returns {file name: JSON text} of the search index: manifest.json
+    (settings and the list of shards), docs-<n>.json (chunks of
+    [type, title, url, subtitle] rows; document ids are positions in the
+    concatenated chunks) and one <prefix>.json per token prefix mapping each
+    token to the sorted ids of the documents containing it.
+    """
+    shards = {}
+    documents = []
+    for doc_id, (document, tokens) in enumerate(_search_documents(bib_file)):
+        documents.append(document)
+        for token in tokens:
+            shard = shards.setdefault(_search_shard_name(token[:SEARCH_PREFIX_LENGTH]), {})
+            shard.setdefault(token, []).append(doc_id)
+
+    def dump(data):
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+    files = {}
+    for start in range(0, len(documents), SEARCH_DOC_CHUNK_SIZE):
+        files[f"docs-{start // SEARCH_DOC_CHUNK_SIZE}.json"] = dump(documents[start:start + SEARCH_DOC_CHUNK_SIZE])
+    for name, postings in shards.items():
+        files[f"{name}.json"] = dump(postings)
+    files["manifest.json"] = dump({
+        'version': SEARCH_INDEX_VERSION,
+        'prefix_length': SEARCH_PREFIX_LENGTH,
+        'chunk_size': SEARCH_DOC_CHUNK_SIZE,
+        'documents': len(documents),
+        'shards': sorted(shards),
+    })
+    return files
+
+@profiled()
+def write_search_index(site_dir, bib_file=BIB_FILE):
+    """Writes the search index (see _search_index_files) under SEARCH_INDEX_DIR in the built site."""
+    target_dir = os.path.join(site_dir, SEARCH_INDEX_DIR)
+    shutil.rmtree(target_dir, ignore_errors=True)
+    os.makedirs(target_dir)
+    for name, text in _search_index_files(bib_file).items():
+        with open(os.path.join(target_dir, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+            _count('bytes_written', f.tell())
+
+# --- ROTATING GRIDS ---
+# Candidates of each folder read by generate_rotating_grid during the current
+# build, so that grids over the same folder share one listing:
+# folder -> ([(date, path, metadata)], paths)
+_ROTATING_ITEMS = {}
+
+def _rotating_candidates(folder):
+    """
+    Returns [(date, path, metadata)] for the non-draft Markdown files under
+    `folder` (recursively), in listing order. Computed once per build; treat
+    the list as read-only.
+    """
+    if folder in _ROTATING_ITEMS:
+        candidates, paths = _ROTATING_ITEMS[folder]
+        # Replay the inputs for the macro cache of the current caller
+        list_markdown_files(folder, recursive=True)
+        for path in paths:
+            _track(path)
+        return candidates
+
+    candidates = []
+    paths = []
+    # Walk through files in folder and subfolders
+    for filepath in list_markdown_files(folder, recursive=True):
+        post = get_metadata(filepath)
+        paths.append(filepath)
+
+        # Ignore drafts
+        if post.get('draft') is True: continue
+        candidates.append((_metadata_date(post), filepath, post))
+
+    _ROTATING_ITEMS[folder] = (candidates, paths)
+    return candidates
+
+def _select_rotating(candidates, limit, order, seed):
+    """
+    Picks the `limit` (all if falsy) candidates shown by a grid without
+    ordering the others: a bounded heap for "newest" (same result as a stable
+    sort), reservoir sampling then a shuffle of the sample for "random".
+    """
+    k = limit if limit and limit > 0 else len(candidates)
+    if order == "newest":
+        return heapq.nlargest(k, candidates, key=lambda candidate: candidate[0])
+
+    rng = random.Random(seed)
+    sample = []
+    for i, candidate in enumerate(candidates):
+        if i < k:
+            sample.append(candidate)
+        else:
+            j = rng.randrange(i + 1)
+            if j < k:
+                sample[j] = candidate
+    rng.shuffle(sample)
+    return sample
+
+def _rotating_item(post_date, filepath, post, keys, routes):
+    """The {'main', 'sub', 'date', 'url'} record of a card."""
+    # Extract Data based on keys
+    main_text = ""
+    sub_text = ""
+
+    # First key is the Headline
+    if len(keys) > 0:
+        val = post.get(keys[0], "Untitled")
+        main_text = str(val) if val else ""
+
+    # Subsequent keys are Description/Subtext
+    if len(keys) > 1:
+        sub_values = []
+        for k in keys[1:]:
+            val = post.get(k)
+            if val:
+                if isinstance(val, list):
+                    val = ", ".join(str(v) for v in val)
+                sub_values.append(str(val))
+        sub_text = " • ".join(sub_values)
+
+    return {
+        'main': main_text,
+        'sub': sub_text,
+        'date': post_date,
+        'url': _page_url(filepath, post, routes)
+    }
+
+def _rotating_seed(seed, candidates):
+    """
+    Resolves the seed of a "random" grid: "content" hashes the paths of the
+    candidates (the order only changes when files are added or removed),
+    "date" is today's date (a new order every day), anything else is used
+    as is.
+    """
+    if seed == "content":
+        return hashlib.sha256("\n".join(path for _, path, _ in candidates).encode('utf-8')).hexdigest()
+    if seed == "date":
+        return datetime.date.today().isoformat()
+    return str(seed)
+
+# --- MACRO OUTPUT CACHE ---
+# Any edit to this module invalidates every cached macro output
+_CODE_DIGEST = _file_digest(__file__)
+
+def _macro_cache_dir():
+    return os.path.join(CACHE_DIR, "macros")
+
+def _read_macro_cache(cache_file):
+    """Returns the cached entry if every input it was built from is unchanged."""
+    try:
+        with open(cache_file, 'rb') as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        return None
+    _count('files_read')
+    for path, fingerprint in cached['dependencies'].items():
+        if _path_fingerprint(path) != fingerprint:
+            return None
+    _count('cache_hits')
+    # Mark as recently used for eviction
+    os.utime(cache_file)
+    return cached
+
+def _evict_macro_cache():
+    """Drops least recently used outputs until the cache fits MACRO_CACHE_MAX_BYTES."""
+    with os.scandir(_macro_cache_dir()) as it:
+        files = [(item.stat().st_mtime_ns, item.stat().st_size, item.path) for item in it]
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if total <= MACRO_CACHE_MAX_BYTES:
+            break
+        os.remove(path)
+        total -= size
+
+def clear_cache(everything=False):
+    """Deletes the macro output cache (or all of CACHE_DIR with everything=True)."""
+    if not CACHE_DIR:
+        return
+    shutil.rmtree(CACHE_DIR if everything else _macro_cache_dir(), ignore_errors=True)
+
+def cached_macro(func):
+    """
+    Caches the output of a macro on disk (CACHE_DIR/macros). Entries are keyed
+    on the macro name, its arguments and this module's source, and are reused
+    only while every input the original call read (see _track) is unchanged.
+    Calls that read no tracked input (e.g. a missing folder) are not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not CACHE_DIR or not MACRO_CACHE_ENABLED:
+            return func(*args, **kwargs)
+
+        call = repr((func.__name__, args, sorted(kwargs.items()), _CODE_DIGEST))
+        key = hashlib.sha256(call.encode('utf-8')).hexdigest()
+        cache_file = os.path.join(_macro_cache_dir(), f"{key}.pickle")
+
+        cached = _read_macro_cache(cache_file)
+        if cached is not None:
+            # Enclosing cached calls depend on these inputs too
+            for path in cached['dependencies']:
+                _track(path)
+            return cached['output']
+
+        _DEPENDENCIES.append({})
+        try:
+            output = func(*args, **kwargs)
+        finally:
+            dependencies = _DEPENDENCIES.pop()
+        for path, fingerprint in dependencies.items():
+            for outer in _DEPENDENCIES:
+                outer.setdefault(path, fingerprint)
+
+        if dependencies:
+            os.makedirs(_macro_cache_dir(), exist_ok=True)
+            tmp_file = cache_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump({'dependencies': dependencies, 'output': output}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                _count('bytes_written', f.tell())
+            os.replace(tmp_file, cache_file)
+            _evict_macro_cache()
+        return output
+    return wrapper
+
+def _prepare_build():
+    """Work done once per build, before any page is rendered."""
+    # Clear once per process, not on every `mkdocs serve` reload
+    if os.environ.get("MAIN_CLEAR_CACHE") == "1" and not getattr(_STATE, "cache_cleared", False):
+        clear_cache()
+        _STATE.cache_cleared = True
+
+    _FOLDER_LISTINGS.clear()
+    _BLOG_ROUTES.clear()
+    _ROTATING_ITEMS.clear()
+    refresh_asset_indexes()
+    create_publication_pages()
 
 def define_env(env):
-    
+    global PROFILE_ENABLED
+    if env.conf.get('extra', {}).get('main_profile'):
+        PROFILE_ENABLED = True
+    _PROFILE.clear()
+    configure_blog(env.conf)
+
     # 1. Generate pages immediately when environment loads
-    create_publication_pages()
+    with profiled_scope("define_env"):
+        _prepare_build()
 
     @env.macro
-    def generate_publication_table(bib_file=BIB_FILE):
-        entries = load_bib_data(bib_file)
-        if not entries:
+    @profiled("macro:generate_publication_table")
+    @cached_macro
+    def generate_publication_table(bib_file=BIB_FILE, page_size=None):
+        """
+        Renders the publication table. With `page_size`, only the newest
+        `page_size` rows are rendered server-side; the rest are loaded on
+        demand from the JSON feed (see write_publication_feed) by
+        javascripts/publications-table.js, which also filters and sorts them.
+        """
+        index = load_bib_index(bib_file)
+        if not index:
             return f"<p style='color:red'>Error: Could not find {bib_file}</p>"
 
-        # Table Header
-        html = dedent("""
-        <div class="table-container">
-        <table class="neon-table">
-            <thead>
-                <tr>
-                    <th width="10%">Year</th>
-                    <th width="60%">Title & Authors</th>
-                    <th width="15%">Venue</th>
-                    <th width="15%">Links</th>
-                </tr>
-            </thead>
-            <tbody>
-        """)
+        if page_size:
+            rows = _publication_rows(_first_page_entries(bib_file, page_size))
+            context = {'feed_url': "/" + PUB_FEED_PATH, 'page_size': page_size, 'total': len(index)}
+        else:
+            rows = load_publications(bib_file)
+            context = {}
 
-        for entry in entries:
-            title = clean_text(entry.get('title', 'Untitled'))
-            authors = format_authors(entry)
-            venue = entry.get('journal') or entry.get('booktitle') or "Preprint"
-            year = entry.get('year', 'N/A')
-            citation_key = entry.get('ID')
-
-            # Generate Link Buttons
-            links_html = generate_buttons_html(entry)
-            
-            # Create Link to the individual page
-            page_link = f"/publications/{citation_key}/"
+        # Rows are produced lazily and streamed through the template
+        template = get_template(PUB_TABLE_TEMPLATE)
+        html = "".join(template.generate(rows=rows, **context))
+        return Markup(html)
 
-            # ADD ROW
-            html += dedent(f"""
-            <tr>
-                <td class="year-cell">{year}</td>
-                <td>
-                    <div class="pub-title">
-                        <a href="{page_link}" class="title-link">{title}</a>
-                    </div>
-                    <div class="pub-authors">{authors}</div>
-                </td>
-                <td class="venue-cell">{venue}</td>
-                <td style="text-align: center;">
-                    {links_html}
-                </td>
-            </tr>
-            """)
+    @env.macro
+    @profiled("macro:publications_by")
+    @cached_macro
+    def publications_by(kind, key, bib_file=BIB_FILE):
+        """
+        Renders the publication table of one index value, e.g.
+        publications_by("author", "vasiliki-bitsouni"). `key` is the slug of
+        the value (see _index_slug) or the value itself.
+        """
+        index = load_bib_indexes(bib_file).get(kind, {})
+        record = index.get(key) or index.get(_index_slug(str(key)))
+        if record is None:
+            return Markup(f"<p>No publications found for {kind} <em>{Markup.escape(key)}</em>.</p>")
+        rows = bib_publications(bib_file, record['entries'])
+        template = get_template(PUB_TABLE_TEMPLATE)
+        return Markup("".join(template.generate(rows=rows)))
+
+    @env.macro
+    @profiled("macro:publication_index_links")
+    @cached_macro
+    def publication_index_links(kind, limit=None, bib_file=BIB_FILE):
+        """
+        Renders the values of an index (authors, venues, years or keywords)
+        as links to their pages, with publication counts.
+        """
+        records = _sorted_index(kind, load_bib_indexes(bib_file).get(kind, {}))
+        if limit:
+            records = records[:limit]
+        items = []
+        for slug, record in records:
+            name = Markup.escape(record['name'])
+            url = publication_index_url(kind, slug)
+            label = f'<a href="{url}">{name}</a>' if url else name
+            items.append(f'<li>{label} <span class="pub-index-count">{len(record["entries"])}</span></li>')
+        return Markup(f'<ul class="pub-index-list">{"".join(items)}</ul>')
+
+    @env.macro
+    def generate_search_box(placeholder="Search publications, talks, posts and projects"):
+        """
+        Renders a search box over the index of write_search_index. The shards
+        are fetched by javascripts/site-search.js as the query needs them.
+        """
+        return Markup(dedent(f"""
+        <div class="site-search" data-index="/{SEARCH_INDEX_DIR}/">
+            <input type="search" class="site-search-input" placeholder="{Markup.escape(placeholder)}" aria-label="{Markup.escape(placeholder)}" autocomplete="off">
+            <p class="site-search-status" aria-live="polite"></p>
+            <ul class="site-search-results"></ul>
+        </div>
+        """))
 
-        html += "</tbody></table></div>"
-        return Markup(html)
-    
     @env.macro
+    def blog_post_url(path):
+        """
+        Returns the URL of a blog post from its path under the posts folder,
+        e.g. blog_post_url("docker/compose.md"), or "" if it is not a post.
+        """
+        return blog_routes().get(os.path.abspath(os.path.join(_blog_posts_dir(), path)), "")
+
+    @env.macro
+    @profiled("macro:generate_talks_grid")
+    @cached_macro
     def generate_talks_grid(folder="docs/talks"):
         talks = []
         if not os.path.exists(folder):
             return f"<p style='color:red'>Folder not found: {folder}</p>"
 
-        for filename in os.listdir(folder):
-            if filename.endswith(".md") and filename != "index.md":
-                filepath = os.path.join(folder, filename)
-                with open(filepath, encoding='utf-8') as f:
-                    post = frontmatter.load(f)
-                    if post.get('draft') is True: continue
-
-                    talk_data = {
-                        'title': post.get('title', 'Untitled'),
-                        'date': post.get('date', datetime.date.min),
-                        'short_conference_title': post.get('short_conference_title', 'Unknown Venue'),
-                        'description': post.get('description', ''),
-                        'url': filename.replace('.md', '/'), 
-                    }
-                    talks.append(talk_data)
+        for filepath in list_markdown_files(folder):
+            filename = os.path.basename(filepath)
+            post = get_metadata(filepath)
+            if post.get('draft') is True: continue
+
+            talk_data = {
+                'title': post.get('title', 'Untitled'),
+                'date': post.get('date', datetime.date.min),
+                'short_conference_title': post.get('short_conference_title', 'Unknown Venue'),
+                'description': post.get('description', ''),
+                'url': filename.replace('.md', '/'), 
+            }
+            talks.append(talk_data)
 
         talks.sort(key=lambda x: x['date'], reverse=True)
 
@@ -356,25 +2989,25 @@ def define_env(env):
         return Markup(html)
 
     @env.macro
+    @profiled("macro:generate_projects_grid")
+    @cached_macro
     def generate_projects_grid(folder="docs/projects"):
         projects = []
         if not os.path.exists(folder):
             return f"<p>Folder not found: {folder}</p>"
 
-        for filename in os.listdir(folder):
-            if filename.endswith(".md") and filename != "index.md":
-                filepath = os.path.join(folder, filename)
-                with open(filepath, encoding='utf-8') as f:
-                    post = frontmatter.load(f)
-                    if post.get('draft') is True: continue
-
-                    projects.append({
-                        'title': post.get('title', 'Untitled'),
-                        'description': post.get('description', ''),
-                        'url': filename.replace('.md', '/'),
-                        'tags': post.get('tags', []),
-                        'weight': post.get('weight', 0)
-                    })
+        for filepath in list_markdown_files(folder):
+            filename = os.path.basename(filepath)
+            post = get_metadata(filepath)
+            if post.get('draft') is True: continue
+
+            projects.append({
+                'title': post.get('title', 'Untitled'),
+                'description': post.get('description', ''),
+                'url': filename.replace('.md', '/'),
+                'tags': post.get('tags', []),
+                'weight': post.get('weight', 0)
+            })
 
         projects.sort(key=lambda x: (x['weight'], x['title']), reverse=True)
 
@@ -400,18 +3033,33 @@ def define_env(env):
         return Markup(html)
 
     @env.macro
+    @profiled("macro:generate_rotating_grid")
     def generate_rotating_grid(folder="docs/quotes", interval=5000, keys=None, 
                                title="Highlights", icon="fa-solid fa-star", 
                                url="#", url_text="View All",
-                               width=1, height=1, limit=5, order="random"):
+                               width=1, height=1, limit=5, order="random", seed=None):
         """
         Rotates through markdown files in a folder and subfolders. Includes Progress Bar and Hover-Pause.
+        Emits markup only; javascripts/rotating-cards.js drives every card.
+
+        order="random" is a seeded shuffle, so the output only changes when
+        the seed does: `seed` (default ROTATING_GRID_SEED) is "content",
+        "date" or a fixed value, see _rotating_seed.
         """
-        
+        if seed is None:
+            seed = ROTATING_GRID_SEED
+        # Resolved here so the cache key of the date seed changes every day
+        if seed == "date":
+            seed = _rotating_seed(seed, None)
+        return _rotating_grid(folder, interval, keys, title, icon, url, url_text,
+                              width, height, limit, order, seed)
+
+    @cached_macro
+    def _rotating_grid(folder, interval, keys, title, icon, url, url_text,
+                       width, height, limit, order, seed):
         if keys is None:
             keys = ['title', 'description'] # Default fallback
 
-        items = []
         if not os.path.exists(folder):
             return dedent(f"""
             <div class='bento-card' style='grid-column: span {width}; grid-row: span {height};'>
@@ -421,123 +3069,20 @@ def define_env(env):
             </div>
             """)
 
-        # Walk through files in folder and subfolders
-        for root, dirs, files in os.walk(folder):
-            for filename in files:
-                if filename.endswith(".md") and filename != "index.md":
-                    filepath = os.path.join(root, filename)
-                    with open(filepath, encoding='utf-8') as f:
-                        post = frontmatter.load(f)
-                        
-                        # Ignore drafts
-                        if post.get('draft') is True: continue
-                        
-                        # Extract Data based on keys
-                        main_text = ""
-                        sub_text = ""
-                        
-                        # First key is the Headline
-                        if len(keys) > 0:
-                            val = post.get(keys[0], "Untitled")
-                            main_text = str(val) if val else ""
-
-                        # Subsequent keys are Description/Subtext
-                        if len(keys) > 1:
-                            sub_values = []
-                            for k in keys[1:]:
-                                val = post.get(k)
-                                if val:
-                                    if isinstance(val, list):
-                                        val = ", ".join(str(v) for v in val)
-                                    sub_values.append(str(val))
-                            sub_text = " • ".join(sub_values)
-
-                        # Extract Date
-                        raw_date = post.get('date')
-                        final_date = datetime.date.min
-                        if isinstance(raw_date, (datetime.date, datetime.datetime)):
-                            final_date = raw_date
-                        elif isinstance(raw_date, str):
-                            try:
-                                final_date = datetime.datetime.strptime(raw_date, "%Y-%m-%d").date()
-                            except ValueError:
-                                pass
-
-                        # Construct URL based on relative path from 'docs'
-                        try:
-                            # Safely get relative path from docs folder
-                            rel_path = os.path.relpath(filepath, "docs")
-                        except ValueError:
-                            # Fallback if path logic fails
-                            rel_path = filepath
-                        
-                        # Standard URL
-                        item_url = "/" + rel_path.replace(os.sep, "/").replace(".md", "/")
-
-                        # Special Handling for Blog Posts
-                        path_segments = rel_path.split(os.sep)
-                        if "posts" in path_segments:
-                            try:
-                                posts_idx = path_segments.index("posts")
-                                base_blog_path = "/".join(path_segments[:posts_idx])
-                                
-                                # 1. Determine Slug (Title/Metadata Priority)
-                                slug = post.get('slug')
-                                if not slug and post.get('title'):
-                                    slug = _slugify(post.get('title'))
-                                
-                                # Fallback: Filename
-                                if not slug:
-                                    if len(filename) > 10 and filename[4] == '-' and filename[7] == '-':
-                                        slug = _slugify(filename[11:].replace(".md", ""))
-                                    else:
-                                        slug = _slugify(filename.replace(".md", ""))
-                                
-                                post_year, post_month, post_day = None, None, None
-
-                                # Strategy A: Filename Date (Standard)
-                                if len(filename) > 10 and filename[4] == '-' and filename[7] == '-':
-                                    # Very basic check: 2023-01-01-...
-                                    y, m, d = filename[0:4], filename[5:7], filename[8:10]
-                                    if y.isdigit() and m.isdigit() and d.isdigit():
-                                        post_year, post_month, post_day = y, m, d
-
-                                # Strategy B: Frontmatter Date (Fallback)
-                                if not post_year and isinstance(final_date, (datetime.date, datetime.datetime)):
-                                    if final_date != datetime.date.min: # ensure it's not the default
-                                        post_year = f"{final_date.year:04d}"
-                                        post_month = f"{final_date.month:02d}"
-                                        post_day = f"{final_date.day:02d}"
-
-                                # Construct Blog URL if we have a date
-                                if post_year and post_month and post_day:
-                                    if base_blog_path:
-                                        item_url = f"/{base_blog_path}/{post_year}/{post_month}/{post_day}/{slug}/"
-                                    else:
-                                        item_url = f"/{post_year}/{post_month}/{post_day}/{slug}/"
-                            except Exception:
-                                pass 
-
-                        items.append({
-                            'main': main_text,
-                            'sub': sub_text,
-                            'date': final_date,
-                            'url': item_url
-                        })
-
-        # --- OPTIMIZATION & SORTING ---
-        if order == "newest":
-             items.sort(key=lambda x: x['date'], reverse=True)
-        else:
-            random.shuffle(items)
-        
-        if limit and limit > 0:
-            items = items[:limit]
+        candidates = _rotating_candidates(folder)
+        if order != "newest":
+            seed = f"{_rotating_seed(seed, candidates)}:{folder}"
+        # Full records are only built for the cards that are shown
+        routes = blog_routes_for(folder)
+        items = [_rotating_item(*candidate, keys, routes)
+                 for candidate in _select_rotating(candidates, limit, order, seed)]
 
         if not items:
             return ""
 
-        unique_id = f"rotator-{random.randint(1000, 9999)}"
+        # Stable across builds: derived from the call, not from the seed
+        unique_id = "rotator-" + hashlib.sha1(
+            repr((folder, keys, title, order, limit)).encode('utf-8')).hexdigest()[:10]
         grid_style = f"grid-column: span {width}; grid-row: span {height};"
 
         # Auto-detect tall card
@@ -561,7 +3106,7 @@ def define_env(env):
 
         # --- HTML CONSTRUCTION ---
         html = dedent(f"""
-        <div class="{card_classes}" id="{unique_id}" style="{grid_style}">
+        <div class="{card_classes}" id="{unique_id}" style="{grid_style}" data-rotator data-interval="{interval}">
             
             <div class="card-static-header">
                 {icon_html}
@@ -570,7 +3115,7 @@ def define_env(env):
 
             <!-- PROGRESS BAR -->
             <div class="ticker-bar-container">
-                <div class="ticker-bar" style="animation-duration: {interval}ms;"></div>
+                <div class="ticker-bar"></div>
             </div>
 
             <div class="rotating-wrapper">
@@ -598,40 +3143,42 @@ def define_env(env):
         </div>
         """)
 
-        # --- JS (SYNCED via Animation End) ---
-        html += dedent(f"""
-        <script>
-        (function() {{
-            const container = document.getElementById('{unique_id}');
-            if (!container) return;
-            
-            const items = container.querySelectorAll('.rotating-item');
-            const bar = container.querySelector('.ticker-bar');
-            if (items.length < 2 || !bar) return;
-            
-            let currentIndex = 0;
-
-            // Start the animation
-            bar.classList.add('animate-progress');
-
-            // When animation finishes, swap slides
-            bar.addEventListener('animationend', () => {{
-                // 1. Swap Classes
-                items[currentIndex].classList.remove('active');
-                
-                let nextIndex;
-                do {{ nextIndex = Math.floor(Math.random() * items.length); }} while (nextIndex === currentIndex);
-                
-                items[nextIndex].classList.add('active');
-                currentIndex = nextIndex;
-
-                // 2. Reset Animation (Force Reflow)
-                bar.classList.remove('animate-progress');
-                void bar.offsetWidth; // Trigger reflow
-                bar.classList.add('animate-progress');
-            }});
-        }})();
-        </script>
-        """)
+        return Markup(html)
+
 
-        return Markup(html)
\ No newline at end of file
+def on_post_build(env):
+    """Writes the build artifacts that live next to the generated HTML."""
+    with profiled_scope("on_post_build"):
+        write_publication_feed(env.conf['site_dir'])
+        copy_publication_images(env.conf['site_dir'])
+        write_search_index(env.conf['site_dir'])
+        publish_publication_pdfs(env.conf['site_dir'])
+    write_profile_report()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintenance commands for the site build.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    clear = commands.add_parser("clear-cache", help="delete the cached macro output")
+    clear.add_argument("--all", action="store_true", help=f"delete everything under {CACHE_DIR}")
+    enrich = commands.add_parser("enrich", help=f"fetch missing DOI/arXiv metadata into {ENRICHMENT_CACHE}")
+    enrich.add_argument("--bib", default=BIB_FILE, help="BibTeX file to enrich")
+    enrich.add_argument("--refresh", action="store_true", help="fetch again even if cached")
+    enrich.add_argument("--retry-failed", action="store_true", help="fetch again the lookups that failed")
+    enrich.add_argument("--concurrency", type=int, default=ENRICH_CONCURRENCY, help="requests in flight")
+    enrich.add_argument("--timeout", type=float, default=ENRICH_TIMEOUT, help="seconds per request")
+    enrich.add_argument("--crossref-url", help=f"base URL of the Crossref works API ({ENRICH_CROSSREF_URL})")
+    enrich.add_argument("--arxiv-url", help=f"arXiv API query URL ({ENRICH_ARXIV_URL})")
+    args = parser.parse_args()
+
+    if args.command == "clear-cache":
+        clear_cache(everything=args.all)
+    elif args.command == "enrich":
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+        ENRICH_CROSSREF_URL = args.crossref_url or ENRICH_CROSSREF_URL
+        ENRICH_ARXIV_URL = args.arxiv_url or ENRICH_ARXIV_URL
+        count = enrich_bibliography(args.bib, refresh=args.refresh, retry_failed=args.retry_failed,
+                                    concurrency=args.concurrency, timeout=args.timeout)
+        print(f"{count} lookups, results in {ENRICHMENT_CACHE}")
@@ -0,0 +1,62 @@
+"""BibTeX name grammar: parse_author_name, parse_authors, latex_to_unicode."""
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("name, expected", [
+    # First von Last
+    ("Ludwig van Beethoven", ("Ludwig", "van", "Beethoven", "")),
+    ("Jean de La Fontaine", ("Jean", "de", "La Fontaine", "")),
+    ("Charles Louis Xavier Joseph de la Vall{\\'e}e Poussin",
+     ("Charles Louis Xavier Joseph", "de la", "Vallée Poussin", "")),
+    ("Lastname", ("", "", "Lastname", "")),
+    ("Ana~Pe\\~na", ("Ana", "", "Peña", "")),
+    # von Last, First
+    ("van Beethoven, Ludwig", ("Ludwig", "van", "Beethoven", "")),
+    ("de la Fontaine, Jean", ("Jean", "de la", "Fontaine", "")),
+    ("M{\\o}ller, Jens", ("Jens", "", "Møller", "")),
+    # von Last, Jr, First
+    ("Ford, Jr., Henry", ("Henry", "", "Ford", "Jr.")),
+    ("Smith, Jr, John", ("John", "", "Smith", "Jr")),
+    # Braced groups stay together and are never "von"
+    ("{Barnes and Noble, Inc.}", ("", "", "Barnes and Noble, Inc.", "")),
+    ("{von Neumann}, John", ("John", "", "von Neumann", "")),
+    # Accents
+    ("{\\'E}mile Zola", ("Émile", "", "Zola", "")),
+    ("Paul Erd{\\H o}s", ("Paul", "", "Erdős", "")),
+    ("Kurt G\\\"odel", ("Kurt", "", "Gödel", "")),
+    ("J\\\"{o}rg M\\\"uller", ("Jörg", "", "Müller", "")),
+])
+def test_parse_author_name(name, expected):
+    assert main.parse_author_name(name) == expected
+
+
+@pytest.mark.parametrize("field, expected", [
+    ("Doe, Jane and John Smith", "Jane Doe, John Smith"),
+    ("Doe, Jane and John Smith and others", "Jane Doe, John Smith, et al."),
+    ("{Barnes and Noble} and Ludwig van Beethoven", "Barnes and Noble, Ludwig van Beethoven"),
+    ("{AT\\&T} Research and Erd\\H{o}s, Paul", "AT&T Research, Paul Erdős"),
+    ("Ford, Jr., Henry", "Henry Ford Jr."),
+])
+def test_format_author_field(field, expected):
+    assert main.format_authors({'author': field}) == expected
+
+
+def test_parse_authors_others():
+    assert main.parse_authors("Doe, Jane and others") == (("Jane", "", "Doe", ""), None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Caf\\'{e}", "Café"),
+    ("na\\\"ive", "naïve"),
+    ("{\\ss}", "ß"),
+    ("\\c{c}", "ç"),
+    ("\\v s", "š"),
+    ("\\aa{}", "å"),
+    ("\\'\\i", "í"),
+    ("{GPU}s", "GPUs"),
+    ("Smith~\\&~Sons", "Smith & Sons"),
+])
+def test_latex_to_unicode(text, expected):
+    assert main.latex_to_unicode(text) == expected
@@ -0,0 +1,84 @@
+"""Chunked reading of .bib files: _iter_bib_records and _parse_bib_chunks."""
+import os
+
+import pytest
+
+import main
+
+
+def records(tmp_path, text):
+    bib_file = tmp_path / "test.bib"
+    bib_file.write_text(text, encoding="utf-8")
+    return list(main._iter_bib_records(str(bib_file)))
+
+
+def test_one_record_per_entry(tmp_path):
+    text = ("@article{a,\n  title = {One},\n}\n"
+            "@book{b,\n  title = {Two},\n}\n")
+    assert records(tmp_path, text) == ["@article{a,\n  title = {One},\n}\n",
+                                       "@book{b,\n  title = {Two},\n}\n"]
+
+
+def test_text_between_records_is_skipped(tmp_path):
+    text = "Free text is a comment.\n@misc{a, title = {X}}\n% also skipped\n"
+    assert records(tmp_path, text) == ["@misc{a, title = {X}}\n"]
+
+
+def test_nested_and_escaped_braces(tmp_path):
+    text = ("@article{a,\n  title = {A {Nested} title with \\} and \\{},\n}\n"
+            "@article{b, title = {B}}\n")
+    assert [record.split(",")[0] for record in records(tmp_path, text)] == ["@article{a", "@article{b"]
+
+
+def test_parenthesized_records_and_directives(tmp_path):
+    text = ('@string(venue = "Journal")\n'
+            "@preamble{ \"\\newcommand{\\x}{x}\" }\n"
+            "@inproceedings(c,\n  booktitle = venue,\n)\n")
+    assert [main._BIB_RECORD_RE.match(record).group(1) for record in records(tmp_path, text)] == \
+        ["string", "preamble", "inproceedings"]
+
+
+def test_unterminated_record_is_yielded(tmp_path):
+    assert records(tmp_path, "@article{a,\n  title = {Open\n") == ["@article{a,\n  title = {Open\n"]
+
+
+def test_strings_carry_over_between_chunks(tmp_path):
+    bib_file = tmp_path / "strings.bib"
+    bib_file.write_text('@string{venue = "Journal of Tests"}\n'
+                        "@article{a, title = {A}, journal = venue}\n"
+                        "@article{b, title = {B}, journal = venue}\n", encoding="utf-8")
+    # Chunks count records: the @string one yields no entry
+    chunks = list(main._parse_bib_chunks(str(bib_file), 1))
+    assert [[entry['ID'] for entry in chunk] for chunk in chunks] == [[], ["a"], ["b"]]
+    assert chunks[2][0]['journal'] == "Journal of Tests"
+
+
+@pytest.mark.parametrize("restarted", [False, True])
+def test_edit_reuses_unchanged_records(tmp_path, monkeypatch, restarted):
+    monkeypatch.setattr(main, "CACHE_DIR", str(tmp_path / "cache"))
+    bib_file = tmp_path / "edited.bib"
+    path = str(bib_file)
+    records = [f"@article{{k{i}, title = {{Title {i}}}, year = {{2020}}}}\n" for i in range(5)]
+    bib_file.write_text("".join(records), encoding="utf-8")
+    list(main._write_bib_chunks(path, main._file_digest(path), 2))
+    if restarted:
+        # A new process: the record locations are read back from the cache
+        main._BIB_RECORDS.pop(os.path.abspath(path), None)
+
+    records[3] = records[3].replace("Title 3", "Edited")
+    bib_file.write_text("".join(records), encoding="utf-8")
+    parsed = []
+    parse = main.bibtexparser.bparser.BibTexParser.parse
+
+    def recording_parse(self, text, *args, **kwargs):
+        parsed.append(text)
+        return parse(self, text, *args, **kwargs)
+
+    monkeypatch.setattr(main.bibtexparser.bparser.BibTexParser, "parse", recording_parse)
+    chunks = list(main._write_bib_chunks(path, main._file_digest(path), 2))
+    main._BIB_RECORDS.pop(os.path.abspath(path), None)
+
+    # Only the edited record is parsed, the others come from the previous chunks
+    assert parsed == [records[3]]
+    assert [entry['title'] for chunk in chunks for entry in chunk] == \
+        ["Title 0", "Title 1", "Title 2", "Edited", "Title 4"]
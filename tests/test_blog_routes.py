@@ -0,0 +1,28 @@
+"""Post URLs of the material/blog plugin: _post_url, configure_blog."""
+import types
+
+import main
+
+
+def test_post_url_uses_the_configured_slugify(tmp_path, monkeypatch):
+    blog = types.SimpleNamespace(
+        blog_dir="blog", post_dir="{blog}/posts", post_url_format="{categories}/{slug}",
+        post_url_date_format="yyyy", post_url_max_categories=1,
+        post_slugify=lambda text, separator: text.upper().replace(" ", separator),
+        post_slugify_separator="_",
+        categories_slugify=lambda text, separator: text.lower().replace(" ", separator),
+        categories_slugify_separator="+",
+    )
+    # configure_blog sets module globals: restore them after the test
+    for name in dir(main):
+        if name.startswith("BLOG_"):
+            monkeypatch.setattr(main, name, getattr(main, name))
+    main.configure_blog({'plugins': {'material/blog': types.SimpleNamespace(config=blog)}})
+
+    post = tmp_path / "post.md"
+    # A byte order mark, as some editors save it, must not hide the header
+    post.write_text("\ufeff---\ndate: 2024-05-15\ncategories: [Open Source]\n---\n\n# My first post\n",
+                    encoding="utf-8")
+    metadata = main._read_frontmatter(str(post))
+    assert metadata['categories'] == ["Open Source"]
+    assert main._post_url(str(post), metadata) == "/blog/open+source/MY_FIRST_POST/"
@@ -0,0 +1,112 @@
+"""enrich_bibliography against a local stub of the Crossref and arXiv APIs."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import main
+
+CROSSREF = {
+    "/works/10.1000/found": {"message": {
+        "DOI": "10.1000/found",
+        "container-title": ["Crossref Journal"],
+        "abstract": "<jats:title>Abstract</jats:title><jats:p>Found by  DOI.</jats:p>",
+    }},
+}
+ARXIV = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v2</id>
+    <summary>  Found on
+      arXiv. </summary>
+    <arxiv:journal_ref>Phys. Rev. X 1 (2021)</arxiv:journal_ref>
+    <arxiv:doi>10.1000/arxiv</arxiv:doi>
+  </entry>
+</feed>
+"""
+BIB = """@article{found,
+  title = {Found},
+  journal = {Own Journal},
+  doi = {10.1000/found},
+}
+@article{missing,
+  title = {Missing},
+  doi = {10.1000/missing},
+}
+@misc{preprint,
+  title = {Preprint},
+  eprint = {2101.00001},
+}
+"""
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        self.server.requests.append(self.path)
+        if url.path == "/arxiv":
+            ids = parse_qs(url.query)['id_list'][0].split(",")
+            body, status = (ARXIV.encode(), 200) if "2101.00001" in ids else (b"", 404)
+            content_type = "application/atom+xml"
+        elif url.path in CROSSREF:
+            body, status = json.dumps(CROSSREF[url.path]).encode(), 200
+            content_type = "application/json"
+        else:
+            body, status, content_type = b"Resource not found.", 404, "text/plain"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    monkeypatch.setattr(main, "ENRICH_CROSSREF_URL", base + "/works/")
+    monkeypatch.setattr(main, "ENRICH_ARXIV_URL", base + "/arxiv")
+    monkeypatch.setattr(main, "ENRICHMENT_CACHE", str(tmp_path / "metadata.json"))
+    main._ENRICHMENT.clear()
+    yield server
+    main._ENRICHMENT.clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_enrich_bibliography(stub, tmp_path):
+    bib_file = tmp_path / "publications.bib"
+    bib_file.write_text(BIB, encoding="utf-8")
+
+    assert main.enrich_bibliography(str(bib_file), timeout=5) == 3
+    with open(main.ENRICHMENT_CACHE, encoding="utf-8") as f:
+        records = json.load(f)
+    assert {key: (record['status'], record['fields']) for key, record in records.items()} == {
+        "doi:10.1000/found": (200, {'abstract': "Found by DOI.", 'journal': "Crossref Journal",
+                                    'doi': "10.1000/found"}),
+        "doi:10.1000/missing": (404, {}),
+        "arxiv:2101.00001": (200, {'abstract': "Found on arXiv.", 'journal': "Phys. Rev. X 1 (2021)",
+                                   'doi': "10.1000/arxiv"}),
+    }
+
+    # The bib is never rewritten, and enrichment only fills in missing fields
+    assert bib_file.read_text(encoding="utf-8") == BIB
+    chunks = main._parse_bib_chunks(str(bib_file), main.BIB_CHUNK_SIZE)
+    entries = {entry['ID']: entry for chunk in map(main._apply_enrichment, chunks) for entry in chunk}
+    assert entries['found']['journal'] == "Own Journal"
+    assert entries['found']['abstract'] == "Found by DOI."
+    assert 'abstract' not in entries['missing']
+    assert entries['preprint']['doi'] == "10.1000/arxiv"
+
+    # Every lookup is cached, failures included
+    requests = len(stub.requests)
+    assert main.enrich_bibliography(str(bib_file), timeout=5) == 0
+    assert len(stub.requests) == requests
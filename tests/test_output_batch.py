@@ -0,0 +1,121 @@
+"""OutputBatch: hashed, atomic batches of generated files."""
+import os
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "out"
+    path.mkdir()
+    return path
+
+
+def staging_files():
+    staging = os.path.join(main.CACHE_DIR, "staging")
+    return os.listdir(staging) if os.path.isdir(staging) else []
+
+
+def test_writes_and_hashes(folder):
+    with main.OutputBatch(str(folder)) as batch:
+        batch.write("a.md", "A")
+        batch.write("sub/b.md", "B")
+    assert (folder / "a.md").read_text(encoding="utf-8") == "A"
+    assert (folder / "sub" / "b.md").read_text(encoding="utf-8") == "B"
+    assert batch.hashes == {"a.md": main._content_hash("A"), "sub/b.md": main._content_hash("B")}
+    assert staging_files() == []
+
+
+def test_known_hash_skips_the_file(folder):
+    # The stored hash is trusted: the file is neither read nor rewritten
+    (folder / "a.md").write_text("on disk", encoding="utf-8")
+    with main.OutputBatch(str(folder), {"a.md": main._content_hash("A")}) as batch:
+        batch.write("a.md", "A")
+    assert (folder / "a.md").read_text(encoding="utf-8") == "on disk"
+
+
+@pytest.mark.parametrize("content, rewritten", [("same", False), ("different", True)])
+def test_unknown_hash_compares_content(folder, content, rewritten):
+    page = folder / "a.md"
+    page.write_text("same", encoding="utf-8")
+    os.utime(page, ns=(0, 0))
+    with main.OutputBatch(str(folder), {"a.md": None}) as batch:
+        batch.write("a.md", content)
+    assert page.read_text(encoding="utf-8") == content
+    assert (os.stat(page).st_mtime_ns != 0) == rewritten
+
+
+def test_stage_defers_the_rename_to_the_commit(folder):
+    with main.OutputBatch(str(folder)) as batch:
+        batch.write("a.md", "A")
+        batch.stage()
+        # Staged: written to a temporary file, not yet in place
+        assert len(staging_files()) == 1
+        assert not (folder / "a.md").exists()
+        batch.write("b.md", "B")
+    assert sorted(os.listdir(folder)) == ["a.md", "b.md"]
+    assert staging_files() == []
+
+
+def test_error_after_stage_cleans_up(folder):
+    with pytest.raises(RuntimeError):
+        with main.OutputBatch(str(folder)) as batch:
+            batch.write("a.md", "A")
+            batch.stage()
+            raise RuntimeError
+    assert os.listdir(folder) == []
+    assert staging_files() == []
+
+
+def test_remove(folder):
+    (folder / "old.md").write_text("old", encoding="utf-8")
+    with main.OutputBatch(str(folder)) as batch:
+        batch.remove("old.md")
+    assert os.listdir(folder) == []
+
+
+def test_error_in_block_changes_nothing(folder):
+    (folder / "old.md").write_text("old", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        with main.OutputBatch(str(folder)) as batch:
+            batch.write("a.md", "A")
+            batch.remove("old.md")
+            raise RuntimeError
+    assert os.listdir(folder) == ["old.md"]
+    assert staging_files() == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_failed_write_cleans_up(folder, monkeypatch, workers):
+    monkeypatch.setattr(main, "OUTPUT_BATCH_CHUNK", 2)
+    with pytest.raises(UnicodeEncodeError):
+        with main.OutputBatch(str(folder), workers=workers) as batch:
+            for i in range(5):
+                # A lone surrogate cannot be encoded: the fourth file fails
+                batch.write(f"{i}.md", "\ud800" if i == 3 else str(i))
+    assert os.listdir(folder) == []
+    assert staging_files() == []
+
+
+def test_fingerprints_of_written_files(folder):
+    with main.OutputBatch(str(folder)) as batch:
+        batch.write("a.md", "A")
+    assert batch.fingerprints == {"a.md": main._path_fingerprint(str(folder / "a.md"))}
+
+
+def test_verified_outputs(folder):
+    with main.OutputBatch(str(folder)) as batch:
+        for name in ("same.md", "touched.md", "edited.md"):
+            batch.write(name, "A")
+    page = folder / "touched.md"
+    os.utime(page, ns=(0, 0))
+    (folder / "edited.md").write_text("A\nedited by hand", encoding="utf-8")
+    existing = {"same.md", "touched.md", "edited.md"}
+    verified = main._verified_outputs(str(folder), batch.hashes, batch.fingerprints, existing)
+    # A changed fingerprint alone is not a change: the content is compared
+    assert sorted(verified) == ["same.md", "touched.md"]
+    assert verified["touched.md"] == (main._content_hash("A"), main._path_fingerprint(str(page)))
+    assert main._verified_outputs(str(folder), batch.hashes, batch.fingerprints, {"same.md"}).keys() == {"same.md"}
@@ -0,0 +1,37 @@
+"""Index counts gathered while streaming the bibliography (_count_index_values)."""
+import main
+
+
+BIB = """\
+@article{old, author = {M{\\"u}ller, Anna and Doe, John}, journal = {Venue}, year = {2019}}
+@article{new, author = {Muller, Anna and Muller, Anna}, journal = {Venue}, year = {2024}}
+@article{same, author = {M{\\"u}ller, Anna}, booktitle = {Proceedings}, year = {2024}}
+"""
+
+
+def test_counts_match_the_full_indexes(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CACHE_DIR", None)
+    bib_file = tmp_path / "indexes.bib"
+    bib_file.write_text(BIB, encoding="utf-8")
+    counts = {kind: {} for kind in main.PUB_INDEX_KINDS}
+    for chunk in main.iter_bib_entries(str(bib_file), chunk_size=1):
+        for entry in chunk:
+            main._count_index_values(counts, entry)
+
+    indexes = main.load_bib_indexes(str(bib_file))
+    expected = {kind: {slug: (record['name'], len(record['entries'])) for slug, record in index.items()}
+                for kind, index in indexes.items()}
+    assert {kind: {slug: (name, count) for slug, (name, count, _) in index.items()}
+            for kind, index in counts.items()} == expected
+    # Counted once per entry, named after the newest entry (first in the file among equals)
+    assert counts['author']['anna-muller'][:2] == ["Anna Muller", 3]
+
+
+def test_publications_follow_the_index_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "CACHE_DIR", None)
+    bib_file = tmp_path / "publications.bib"
+    bib_file.write_text(BIB, encoding="utf-8")
+    record = main.load_bib_indexes(str(bib_file))['author']['anna-muller']
+    assert record['entries'] == ["new", "same", "old"]
+    assert [pub.key for pub in main.load_publications(str(bib_file))] == ["new", "same", "old"]
+    assert [pub.key for pub in main.bib_publications(str(bib_file), ["old", "missing", "new"])] == ["old", "new"]